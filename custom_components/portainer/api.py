@@ -1,10 +1,16 @@
 """Portainer API."""
 from __future__ import annotations
 
+import asyncio
+import re
+from collections import Counter
+from functools import cached_property, lru_cache
 from logging import getLogger
-from threading import Lock, Semaphore
+from threading import Lock
+from time import monotonic
 from typing import Any, Optional
 
+import aiohttp
 import requests
 from requests import Session
 from requests.adapters import HTTPAdapter
@@ -16,11 +22,19 @@ from requests.exceptions import (
     ConnectionError as ReqConnectionError,
 )
 try:
+    from urllib3 import disable_warnings  # type: ignore
+    from urllib3.exceptions import InsecureRequestWarning  # type: ignore
     from urllib3.util.retry import Retry  # type: ignore
 except Exception:  # pragma: no cover
     Retry = None  # type: ignore
+    disable_warnings = None  # type: ignore
+try:
+    from orjson import loads as json_loads  # type: ignore
+except Exception:  # pragma: no cover
+    from json import loads as json_loads
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     HTTP_POOL_CONNECTIONS,
@@ -29,7 +43,10 @@ from .const import (
     HTTP_READ_TIMEOUT,
     HTTP_RETRIES_TOTAL,
     HTTP_BACKOFF_FACTOR,
+    HTTP_BACKOFF_JITTER,
     HTTP_STATUS_FORCELIST,
+    HTTP_CACHE_TTL,
+    HTTP_ETAG_SERVICES,
     STATS_MAX_CONCURRENCY,
 )
 
@@ -43,19 +60,35 @@ _LOGGER = getLogger(__name__)
 # - Expose requests_get/requests_post at module scope to allow monkeypatching
 #   in unit tests: tests can do `monkeypatch.setattr(api, "requests_get", ...)`.
 requests_session: Session = requests.Session()
+
+
+def _build_retry() -> Any:
+    """Retry policy with jitter + Retry-After so parallel pollers don't retry in lockstep."""
+    if Retry is None:
+        return None
+    kwargs: dict[str, Any] = {
+        "total": HTTP_RETRIES_TOTAL,
+        "connect": HTTP_RETRIES_TOTAL,
+        "read": HTTP_RETRIES_TOTAL,
+        "backoff_factor": HTTP_BACKOFF_FACTOR,
+        "status_forcelist": HTTP_STATUS_FORCELIST,
+        # POSTs are actions (start/stop/...): a read retry after Docker acted repeats them
+        "allowed_methods": frozenset({"GET"}),
+        "respect_retry_after_header": True,
+        "raise_on_status": False,
+    }
+    try:
+        return Retry(backoff_jitter=HTTP_BACKOFF_JITTER, **kwargs)
+    except TypeError:  # urllib3 < 2.0 has no backoff_jitter
+        return Retry(**kwargs)
+
+
 try:
-    retry = Retry(
-        total=HTTP_RETRIES_TOTAL,
-        connect=HTTP_RETRIES_TOTAL,
-        read=HTTP_RETRIES_TOTAL,
-        backoff_factor=HTTP_BACKOFF_FACTOR,
-        status_forcelist=HTTP_STATUS_FORCELIST,
-        allowed_methods=frozenset({"GET", "POST"}),
-        raise_on_status=False,
-    ) if Retry is not None else None
+    retry = _build_retry()
     adapter = HTTPAdapter(
         pool_connections=HTTP_POOL_CONNECTIONS,
-        pool_maxsize=HTTP_POOL_MAXSIZE,
+        # Never let concurrent callers outnumber pooled sockets (pool churn)
+        pool_maxsize=max(HTTP_POOL_MAXSIZE, STATS_MAX_CONCURRENCY),
         max_retries=retry or 0,
     )
     requests_session.mount("http://", adapter)
@@ -74,6 +107,34 @@ def requests_post(url: str, **kwargs):
     return requests_session.post(url, **kwargs)
 
 
+# Listing services eligible for conditional GETs; "{}" matches one path segment
+_ETAG_SERVICE_RE = re.compile(
+    "|".join(re.escape(t).replace(r"\{\}", "[^/]+") for t in HTTP_ETAG_SERVICES)
+)
+
+# Failure codes that mean Portainer itself is unreachable (vs. one bad path)
+_CONNECTIVITY_FAILURES = frozenset({"timeout", "connection_error", "ssl_error"})
+
+
+@lru_cache(maxsize=256)
+def _service_url(base: str, service: str) -> str:
+    """Join base URL + service once; bounded since inspect paths embed container ids."""
+    return f"{base}{service}"
+
+
+# Stats run on the HA event loop via aiohttp; built once, reused per request.
+_STATS_TIMEOUT = aiohttp.ClientTimeout(
+    connect=HTTP_CONNECT_TIMEOUT, sock_read=HTTP_READ_TIMEOUT
+)
+
+
+def _http_concurrency(client: aiohttp.ClientSession) -> int:
+    """In-flight aiohttp requests per host: STATS_MAX_CONCURRENCY capped by the connector limit."""
+    connector = client.connector
+    limit = (connector.limit_per_host or connector.limit) if connector else 0
+    return min(STATS_MAX_CONCURRENCY, limit) if limit else STATS_MAX_CONCURRENCY
+
+
 class PortainerAPI:
     """Handle all communication with Portainer."""
 
@@ -89,21 +150,50 @@ class PortainerAPI:
         self._host = host
         self._use_ssl = use_ssl
         self._api_key = api_key
-        self._protocol = "https" if self._use_ssl else "http"
         # If not using SSL, keep verify True to avoid warnings from requests
         self._ssl_verify = True if not use_ssl else verify_ssl
-        self._url = f"{self._protocol}://{self._host}/api/"
+        if not self._ssl_verify and disable_warnings is not None:
+            # User opted out of verification: skip the per-request warning machinery
+            disable_warnings(InsecureRequestWarning)
+        # Built once; never mutated (per-call extras go into a copy). Kept off the
+        # shared session because that session serves every configured host.
+        # GETs carry no body, so only POSTs declare Content-Type.
+        self._get_headers: dict[str, str] = {
+            "X-API-Key": f"{self._api_key}",
+            "Accept": "application/json",
+        }
+        self._post_headers: dict[str, str] = {
+            **self._get_headers,
+            "Content-Type": "application/json",
+        }
 
         self.lock = Lock()
         self._connected = False
         self._error: str = ""
-        self._fail_counts: dict[str, int] = {}
+        self._fail_counts: Counter[str] = Counter()
+        # (service, sorted params) -> (monotonic ts, parsed body); see HTTP_CACHE_TTL
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        # Conditional GETs: (service, sorted params) -> last ETag / parsed body
+        self._etags: dict[tuple, str] = {}
+        self._last_body: dict[tuple, Any] = {}
 
         # Use the global session; do not own/close it here.
         self._session: Session = requests_session
 
-        # Global throttle for stats calls to reduce burstiness
-        self._stats_sem = Semaphore(STATS_MAX_CONCURRENCY)
+        # HA-managed aiohttp session for stats; resolved lazily on the event loop.
+        self._client: aiohttp.ClientSession | None = None
+
+        # Bounds in-flight aiohttp requests (stats + control actions) to the
+        # connector limit; created once in _client_session
+        self._http_sem: asyncio.Semaphore | None = None
+
+    @cached_property
+    def _url(self) -> str:
+        return f"{'https' if self._use_ssl else 'http'}://{self._host}/api/"
+
+    @cached_property
+    def _stats_url_fmt(self) -> str:
+        return self._url + "endpoints/{}/docker/containers/{}/stats"
 
     def close(self) -> None:
         """No-op: global session is shared; do not close it here."""
@@ -113,7 +203,9 @@ class PortainerAPI:
         return self._connected
 
     def connection_test(self) -> tuple[bool, str]:
-        self.query("endpoints")
+        # Authenticated (validates the API key) yet tiny: Portainer paginates to one
+        # endpoint; versions without pagination ignore the param and return all.
+        self.query("endpoints", params={"limit": 1})
         return self._connected, self._error
 
     def query(
@@ -121,126 +213,193 @@ class PortainerAPI:
     ) -> Any | None:
         """Retrieve data from Portainer with retries + crisp error logs."""
         params = params or {}
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": f"{self._api_key}",
-        }
-        url = f"{self._url}{service}"
-
-        with self.lock:
-            _LOGGER.debug("Portainer %s %s %s params=%s", self._host, method.upper(), service, params)
-            try:
-                if method == "get":
-                    resp = requests_get(
-                        url,
-                        headers=headers,
-                        params=params,
-                        verify=self._ssl_verify,
-                        timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
-                    )
-                elif method == "post":
-                    resp = requests_post(
-                        url,
-                        headers=headers,
-                        json=params,
-                        verify=self._ssl_verify,
-                        timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
-                    )
-                else:
-                    _LOGGER.warning("Unsupported HTTP method %s for %s", method, service)
-                    return None
-            except (ConnectTimeout, ReadTimeout) as err:
-                self._record_failure(service, "timeout", detail=str(err))
-                self._warn(service, "timeout", f"{type(err).__name__}")
-                return None
-            except SSLError as err:
-                self._record_failure(service, "ssl_error", detail=str(err))
-                self._warn(service, "ssl_error", f"{err}")
-                return None
-            except ReqConnectionError as err:
-                self._record_failure(service, "connection_error", detail=str(err))
-                self._warn(service, "connection_error", f"{err}")
-                return None
-            except RequestException as err:
-                self._record_failure(service, "request_exception", detail=str(err))
-                self._warn(service, "request_exception", f"{err}")
-                return None
-            except Exception as err:  # pragma: no cover
-                self._record_failure(service, "unknown_exception", detail=str(err))
-                self._warn(service, "unknown_exception", f"{err}")
-                return None
+        headers = self._get_headers if method == "get" else self._post_headers
+        url = _service_url(self._url, service)
 
-            # Success
-            if resp is not None and resp.status_code == 200:
-                try:
-                    data = resp.json()
-                except Exception as err:
-                    self._record_failure(service, "invalid_json", detail=str(err))
-                    self._warn(service, "invalid_json", f"{err}")
-                    return None
-                self._record_success(service)
-                _LOGGER.debug("Portainer %s %s -> 200 OK", self._host, service)
-                return data
-
-            # Non-200
-            status = getattr(resp, "status_code", None)
-            reason = getattr(resp, "reason", "")
-            snippet = ""
-            try:
-                txt = resp.text or ""
-                snippet = (txt[:200] + ("..." if len(txt) > 200 else "")).replace("\n", " ")
-            except Exception:
-                pass
-            self._record_failure(service, str(status), detail=reason)
-            self._warn(service, f"http_{status}", f"{reason or 'HTTP error'} | body: {snippet}")
-            return None
+        ttl = 0
+        cache_key: tuple | None = None
+        use_etag = False
+        if method == "get":
+            cache_key = (service, tuple(sorted(params.items())))
+            ttl = HTTP_CACHE_TTL.get(service, 0)
+            hit = self._cache.get(cache_key) if ttl else None
+            if hit is not None and monotonic() - hit[0] < ttl:
+                _LOGGER.debug("Portainer %s %s -> cached", self._host, service)
+                return hit[1]
+            use_etag = _ETAG_SERVICE_RE.fullmatch(service) is not None
+            etag = self._etags.get(cache_key) if use_etag else None
+            if etag:
+                headers = {**headers, "If-None-Match": etag}
 
-    def get_container_stats(self, *, endpoint_id: int | str, container_id: str) -> Any | None:
-        """One-shot Docker stats. Never toggles connected state on errors."""
-        service = f"endpoints/{endpoint_id}/docker/containers/{container_id}/stats"
-        url = f"{self._url}{service}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": f"{self._api_key}",
-        }
-        with self._stats_sem:
-            try:
+        _LOGGER.debug("Portainer %s %s %s params=%s", self._host, method.upper(), service, params)
+        try:
+            if method == "get":
                 resp = requests_get(
                     url,
                     headers=headers,
-                    params={"stream": "false"},
+                    params=params,
                     verify=self._ssl_verify,
                     timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
                 )
-                if resp is not None and resp.status_code == 200:
-                    return resp.json()
-                _LOGGER.debug(
-                    "Portainer stats non-200 for %s: %s (%s)",
-                    container_id,
-                    getattr(resp, "status_code", "no_response"),
-                    getattr(resp, "reason", ""),
+            elif method == "post":
+                resp = requests_post(
+                    url,
+                    headers=headers,
+                    json=params,
+                    verify=self._ssl_verify,
+                    timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
                 )
+            else:
+                _LOGGER.warning("Unsupported HTTP method %s for %s", method, service)
                 return None
+        except (ConnectTimeout, ReadTimeout) as err:
+            self._record_failure(service, "timeout", detail=str(err))
+            self._warn(service, "timeout", f"{type(err).__name__}")
+            return None
+        except SSLError as err:
+            self._record_failure(service, "ssl_error", detail=str(err))
+            self._warn(service, "ssl_error", f"{err}")
+            return None
+        except ReqConnectionError as err:
+            self._record_failure(service, "connection_error", detail=str(err))
+            self._warn(service, "connection_error", f"{err}")
+            return None
+        except RequestException as err:
+            self._record_failure(service, "request_exception", detail=str(err))
+            self._warn(service, "request_exception", f"{err}")
+            return None
+        except Exception as err:  # pragma: no cover
+            self._record_failure(service, "unknown_exception", detail=str(err))
+            self._warn(service, "unknown_exception", f"{err}")
+            return None
+
+        status = resp.status_code
+
+        # Success: parse raw bytes only; text decoding is reserved for errors
+        if status == 200:
+            try:
+                data = json_loads(resp.content)
+            except Exception as err:
+                self._record_failure(service, "invalid_json", detail=str(err))
+                self._warn(service, "invalid_json", f"{err}")
+                return None
+            self._record_success(service)
+            if cache_key is not None:
+                etag = resp.headers.get("ETag") if use_etag else None
+                if etag:
+                    self._etags[cache_key] = etag
+                    self._last_body[cache_key] = data
+                if ttl:
+                    self._cache[cache_key] = (monotonic(), data)
+            _LOGGER.debug("Portainer %s %s -> 200 OK", self._host, service)
+            return data
+
+        # Not modified: reuse the body parsed for the matching ETag
+        if status == 304 and cache_key in self._last_body:
+            data = self._last_body[cache_key]
+            self._record_success(service)
+            if ttl:
+                self._cache[cache_key] = (monotonic(), data)
+            _LOGGER.debug("Portainer %s %s -> 304 Not Modified", self._host, service)
+            return data
+
+        # Non-200
+        reason = getattr(resp, "reason", "")
+        txt = resp.text or ""
+        snippet = (txt[:200] + ("..." if len(txt) > 200 else "")).replace("\n", " ")
+        self._record_failure(service, str(status), detail=reason)
+        self._warn(service, f"http_{status}", f"{reason or 'HTTP error'} | body: {snippet}")
+        return None
+
+    async def get_container_stats(self, *, endpoint_id: int | str, container_id: str) -> Any | None:
+        """One-shot Docker stats on the event loop. Never toggles connected state on errors."""
+        url = self._stats_url_fmt.format(endpoint_id, container_id)
+        session = self._client_session()
+        async with self._http_sem:
+            try:
+                async with session.get(
+                    url,
+                    headers=self._get_headers,
+                    params={"stream": "false"},
+                    timeout=_STATS_TIMEOUT,
+                ) as resp:
+                    if resp.status == 200:
+                        body = await resp.read()
+                        # Stopped containers often answer "{}" or nothing; skip the parser
+                        return json_loads(body) if len(body) > 2 else {}
+                    _LOGGER.debug(
+                        "Portainer stats non-200 for %s: %s (%s)",
+                        container_id,
+                        resp.status,
+                        resp.reason,
+                    )
+                    return None
             except Exception as err:  # noqa: BLE001
                 _LOGGER.debug("Portainer stats error for %s: %s", container_id, err)
                 return None
 
+    async def get_stats_bulk(
+        self, *, endpoint_id: int | str, container_ids: list[str]
+    ) -> dict[str, Any | None]:
+        """Fetch stats for many containers concurrently; failed ones map to None."""
+        results = await asyncio.gather(
+            *(
+                self.get_container_stats(endpoint_id=endpoint_id, container_id=cid)
+                for cid in container_ids
+            ),
+            return_exceptions=True,
+        )
+        return {
+            cid: None if isinstance(res, BaseException) else res
+            for cid, res in zip(container_ids, results)
+        }
+
+    def http_slots(self) -> asyncio.Semaphore:
+        """Semaphore every aiohttp request to this host (stats, actions) must hold."""
+        self._client_session()
+        return self._http_sem
+
+    def invalidate_cache(self, prefix: str = "") -> None:
+        """Drop cached responses whose service starts with prefix (all by default)."""
+        for key in [k for k in self._cache if k[0].startswith(prefix)]:
+            self._cache.pop(key, None)
+        for key in [k for k in self._etags if k[0].startswith(prefix)]:
+            self._etags.pop(key, None)
+            self._last_body.pop(key, None)
+
     # ---- helpers ----
+    def _client_session(self) -> aiohttp.ClientSession:
+        # Shared HA session: pooled keep-alive connections, closed by HA on stop.
+        if self._client is None:
+            self._client = async_get_clientsession(self._hass, verify_ssl=self._ssl_verify)
+        if self._http_sem is None:
+            # Waiting on our semaphore beats queueing inside the connector
+            self._http_sem = asyncio.Semaphore(_http_concurrency(self._client))
+        return self._client
+
+    # The lock guards only the bookkeeping below; HTTP calls run unlocked so
+    # independent queries from executor threads don't serialize.
     def _record_success(self, service: str) -> None:
-        self._fail_counts[service] = 0
-        self._error = ""
-        self._connected = True
+        with self.lock:
+            self._fail_counts[service] = 0
+            self._error = ""
+            self._connected = True
 
     def _record_failure(self, service: str, code: str, *, detail: str = "") -> None:
-        self._fail_counts[service] = self._fail_counts.get(service, 0) + 1
-        self._error = code
-        # Endpoints drives "connected" to avoid flapping on single blips
-        if service == "endpoints":
-            if self._fail_counts[service] >= 2:
-                self._connected = False
-        elif service != "reporting/get_data":
-            if self._fail_counts[service] >= 2:
-                self._connected = False
+        with self.lock:
+            self._fail_counts[service] += 1
+            self._error = code
+            # Don't keep answering from cache while Portainer is unreachable; a
+            # single 404 (e.g. inspect of a just-removed container) keeps it
+            if code in _CONNECTIVITY_FAILURES or service == "endpoints":
+                self._cache.clear()
+            # Endpoints drives "connected" to avoid flapping on single blips
+            if service == "endpoints":
+                if self._fail_counts[service] >= 2:
+                    self._connected = False
+            elif service != "reporting/get_data":
+                if self._fail_counts[service] >= 2:
+                    self._connected = False
 
     def _warn(self, service: str, code: str, detail: str) -> None:
         _LOGGER.warning('Portainer %s failed "%s" [%s]: %s', self._host, service, code, detail)
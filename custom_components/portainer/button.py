@@ -3,24 +3,20 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Iterable, List, Set
+from typing import Any, List, Set
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr 
-import re
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_FEATURE_UPDATE_CHECK,
     DEFAULT_FEATURE_UPDATE_CHECK,
     DOMAIN,
-    # naming option shared with sensors
-    CONF_CONTAINER_SENSOR_NAME_MODE,
-    DEFAULT_CONTAINER_SENSOR_NAME_MODE,
+    # naming modes shared with sensors
     NAME_MODE_SERVICE,
     NAME_MODE_CONTAINER,
     NAME_MODE_STACK_SERVICE,
@@ -31,57 +27,88 @@ from .device_ids import container_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+_UID_PREFIX = f"{DOMAIN}_container_restart_"
+
 # --- helpers for stack ids (keep legacy alias to satisfy existing via_device) ---
-_slug_invalid_re = re.compile(r"[^a-z0-9-]+")
-_dash_collapse_re = re.compile(r"-{2,}")
+# Runs of anything outside [a-z0-9] (including "-", "_" and spaces) collapse to one dash
+_slug_run_re = re.compile(r"[^a-z0-9]+")
 
 def _slugify_stack_name(name: str) -> str:
-    base = (name or "").strip().lower().replace("_", "-").replace(" ", "-")
-    base = _slug_invalid_re.sub("-", base)
-    base = _dash_collapse_re.sub("-", base).strip("-")
+    base = _slug_run_re.sub("-", (name or "").lower()).strip("-")
     return base or "unnamed"
 
-def _ensure_parent_devices(hass: HomeAssistant, entry: ConfigEntry, coord: PortainerCoordinator) -> None:
-    """Create endpoint & stack devices so via_device targets exist before adding entities."""
-    try:
-        devreg = dr.async_get(hass)
+# name mode -> label(service, stack, container_name); unknown modes use the container name
+def _label_container(service: str, stack: str, name: str) -> str:
+    return name
+
+
+_LABEL_FNS = {
+    NAME_MODE_SERVICE: lambda service, stack, name: service or name,
+    NAME_MODE_STACK_SERVICE: lambda service, stack, name: (
+        f"{stack}/{service}" if service and stack else name
+    ),
+    NAME_MODE_CONTAINER: _label_container,
+}
+
 
+def _ensure_parent_devices(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coord: PortainerCoordinator,
+    last_sig: frozenset | None = None,
+) -> frozenset | None:
+    """Create endpoint & stack devices so via_device targets exist before adding entities.
+
+    Returns a signature of the endpoints/stacks handled; pass it back as ``last_sig``
+    to skip the device-registry calls when nothing changed since the previous run.
+    """
+    try:
         # Endpoints
         endpoints = coord.raw_data.get("endpoints", {}) or {}
-        endpoint_ids = set(endpoints.keys())
+        endpoint_ids = set(endpoints)
         if not endpoint_ids:
-            for c in (coord.raw_data.get("containers_by_name", {}) or {}).values():
-                eid = c.get("EndpointId")
-                if eid is not None:
-                    endpoint_ids.add(eid)
-            for s in (coord.raw_data.get("stacks", {}) or {}).values():
-                eid = s.get("EndpointId")
-                if eid is not None:
-                    endpoint_ids.add(eid)
-        for eid in endpoint_ids:
-            name = (endpoints.get(eid, {}) or {}).get("Name") or str(eid)
-            devreg.async_get_or_create(
-                config_entry_id=entry.entry_id,
-                identifiers={(DOMAIN, f"endpoint_{eid}")},
-                manufacturer="Portainer",
-                name=f"Endpoint: {name}",
-            )
+            # indexed containers and parsed stacks always carry an EndpointId
+            endpoint_ids = {
+                c["EndpointId"]
+                for c in (coord.raw_data.get("containers_by_name", {}) or {}).values()
+            } | {
+                s["EndpointId"]
+                for s in (coord.raw_data.get("stacks", {}) or {}).values()
+            }
+        endpoint_names = {
+            eid: (endpoints.get(eid, {}) or {}).get("Name") or str(eid) for eid in endpoint_ids
+        }
 
         # Stacks (canonical underscore scheme + legacy aliases)
         stacks_map = coord.raw_data.get("stacks", {}) or {}
         if not stacks_map:
             for c in (coord.raw_data.get("containers_by_name", {}) or {}).values():
-                eid = c.get("EndpointId")
-                sname = (c.get("Compose_Stack") or "").strip()
+                eid = c["EndpointId"]
+                sname = c["Compose_Stack"].strip()
                 if not eid or not sname:
                     continue
                 sid = f"synth-{eid}:{sname}"
                 stacks_map[f"{eid}:{sid}"] = {"Id": sid, "Name": sname, "EndpointId": eid}
+        stack_rows = [
+            (stack["EndpointId"], str(stack["Id"]), stack["Name"])
+            for stack in stacks_map.values()
+        ]
+
+        sig = frozenset(endpoint_names.items()) | frozenset(stack_rows)
+        if sig == last_sig:
+            return sig
+
+        devreg = dr.async_get(hass)
+        for eid, name in endpoint_names.items():
+            devreg.async_get_or_create(
+                config_entry_id=entry.entry_id,
+                identifiers={(DOMAIN, f"endpoint_{eid}")},
+                manufacturer="Portainer",
+                name=f"Endpoint: {name}",
+            )
 
-        for stack in stacks_map.values():
-            eid = stack.get("EndpointId")
-            sid = str(stack.get("Id"))
-            sname = stack.get("Name") or sid
+        for eid, sid, sname in stack_rows:
+            sname = sname or sid
             sslug = _slugify_stack_name(sname).replace("-", "_")
             identifiers = {
                 (DOMAIN, f"stack_{eid}_{sslug}"),         # canonical (by name)
@@ -95,8 +122,10 @@ def _ensure_parent_devices(hass: HomeAssistant, entry: ConfigEntry, coord: Porta
                 name=f"Stack: {sname}",
                 via_device=(DOMAIN, f"endpoint_{eid}"),
             )
+        return sig
     except Exception as e:  # pragma: no cover
         _LOGGER.debug("Failed to pre-create devices (button): %s", e)
+        return last_sig
 
 
 async def async_setup_entry(  # NOSONAR
@@ -110,121 +139,142 @@ async def async_setup_entry(  # NOSONAR
 
     # Make sure coordinator has data first (so we can pre-create devices correctly)
     await coordinator.async_config_entry_first_refresh()
-    _ensure_parent_devices(hass, config_entry, coordinator)
+    parent_sig = _ensure_parent_devices(hass, config_entry, coordinator)
 
-    # Force Update Check button (always)
-    base_entities: list[ButtonEntity] = [ForceUpdateCheckButton(coordinator, config_entry.entry_id)]
-    async_add_entities(base_entities, update_before_add=False)
+    # containers_by_name keys ("<EndpointId>:<Name>") that already have a button;
+    # they map 1:1 to restart-button unique_ids, so no uid string is built per check
+    created: Set[str] = set()
+    # keys whose button construction raised; retried on every refresh
+    pending: Set[str] = set()
 
     # Helper to build restart buttons for all known containers
     def _build_restart_buttons() -> List[ButtonEntity]:
         buttons: list[ButtonEntity] = []
         containers_by_name = coordinator.raw_data.get("containers_by_name", {}) or {}
-        for c in containers_by_name.values():
+        for key, c in containers_by_name.items():
             try:
                 buttons.append(PortainerContainerRestartButton(coordinator, control, c))
+                created.add(key)
             except Exception as err:  # noqa: BLE001
+                pending.add(key)
                 _LOGGER.debug("Skipping restart button for container due to error: %s", err)
         return buttons
 
-    # Initial pass: add any restart buttons now
+    # Force Update Check button (always) + restart buttons, registered in one batch
+    base_entities: list[ButtonEntity] = [ForceUpdateCheckButton(coordinator, config_entry.entry_id)]
     restart_now = _build_restart_buttons()
+    async_add_entities(base_entities + restart_now, update_before_add=False)
     if restart_now:
-        async_add_entities(restart_now, update_before_add=False)
         _LOGGER.info("Added %d container restart buttons (initial)", len(restart_now))
 
-    # Keep track of what we’ve created (unique_ids) to avoid duplicates
-    created: Set[str] = {e.unique_id for e in base_entities + restart_now if e.unique_id}
-
     @callback
-    async def _async_update_controller(_coordinator):
+    async def _async_update_controller(
+        _coordinator, new_keys: frozenset[str], containers_by_name: dict[str, dict]
+    ):
         """Dynamically add buttons for newly discovered containers."""
+        nonlocal parent_sig
         # Ensure parents exist for any new stacks/endpoints before adding entities
-        _ensure_parent_devices(hass, config_entry, coordinator)
+        parent_sig = _ensure_parent_devices(hass, config_entry, coordinator, parent_sig)
 
         new_buttons: list[ButtonEntity] = []
-        containers_by_name = coordinator.raw_data.get("containers_by_name", {}) or {}
-        for c in containers_by_name.values():
-            uid = f"{DOMAIN}_container_restart_{c.get('EndpointId')}_{c.get('Name')}"
-            if not uid or uid in created:
+        # Only containers that appeared since the previous refresh, plus earlier
+        # failures, can need a button
+        for key in (new_keys | pending) if pending else new_keys:
+            if key in created:
+                continue
+            container = containers_by_name.get(key)
+            if container is None:  # a pending container that has gone away
+                pending.discard(key)
                 continue
             try:
-                btn = PortainerContainerRestartButton(coordinator, control, c)
+                btn = PortainerContainerRestartButton(coordinator, control, container)
                 new_buttons.append(btn)
-                created.add(uid)
+                created.add(key)
+                pending.discard(key)
             except Exception as err:  # noqa: BLE001
+                pending.add(key)
                 _LOGGER.debug("Skipping new restart button due to error: %s", err)
 
         if new_buttons:
             async_add_entities(new_buttons, update_before_add=False)
             _LOGGER.info("Added %d new container restart buttons", len(new_buttons))
 
-    # Listen for coordinator refreshes to add new buttons later
+    # Listen for coordinator refreshes to add new buttons later; the initial batch
+    # above already covers the data from the first refresh.
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, f"{config_entry.entry_id}_update", _async_update_controller)
     )
 
-    # Ensure we run at least once after setup (in case first refresh beat us)
-    await _async_update_controller(coordinator)
 
+class ForceUpdateCheckButton(CoordinatorEntity, ButtonEntity):
+    """Button to force immediate update check (availability pushed by coordinator refreshes)."""
 
-class ForceUpdateCheckButton(ButtonEntity):
-    """Button to force immediate update check."""
+    __slots__ = ("entry_id", "_feature_enabled", "_device_info")
 
     _attr_should_poll = False
 
     def __init__(self, coordinator: PortainerCoordinator, entry_id: str) -> None:
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entry_id = entry_id
 
         self._attr_name = "Force Update Check"
         self._attr_icon = "mdi:update"
         self._attr_unique_id = f"{entry_id}_force_update_check_final"
+        self._device_info = {
+            "identifiers": {(DOMAIN, f"{coordinator.name}_System_{entry_id}")},
+            "name": f"{coordinator.name} System",
+            "manufacturer": "Portainer",
+        }
+
+        # Options changes reload the entry, so the flag is stable for our lifetime
+        self._feature_enabled = self._read_feature_enabled(coordinator.config_entry)
+        self._attr_entity_registry_enabled_default = self._feature_enabled
 
-        feature_enabled = coordinator.config_entry.options.get(
-            CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK
+    @staticmethod
+    def _read_feature_enabled(config_entry) -> bool:
+        return (
+            config_entry.options.get(CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK)
+            is True
         )
-        feature_enabled = feature_enabled is True
-        self._attr_entity_registry_enabled_default = feature_enabled
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, f"{self.coordinator.name}_System_{self.entry_id}")},
-            "name": f"{self.coordinator.name} System",
-            "manufacturer": "Portainer",
-        }
+        return self._device_info
 
     @property
     def available(self) -> bool:
-        feature_enabled = self.coordinator.config_entry.options.get(
-            CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK
-        )
-        feature_enabled = feature_enabled is True
-        return feature_enabled and (
+        return self._feature_enabled and (
             self.coordinator.connected() or getattr(self.coordinator, "last_update_success", False)
         )
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        feature_enabled = self.coordinator.config_entry.options.get(
-            CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK
-        )
-        feature_enabled = feature_enabled is True
-        return feature_enabled
-
     async def async_press(self) -> None:
         _LOGGER.info("Force Update Check button pressed")
         await self.coordinator.force_update_check()
 
     async def async_update_entry(self, config_entry):
         self.coordinator.config_entry = config_entry
+        self._feature_enabled = self._read_feature_enabled(config_entry)
+        self._attr_entity_registry_enabled_default = self._feature_enabled
         self.async_write_ha_state()
 
 
 class PortainerContainerRestartButton(CoordinatorEntity, ButtonEntity):
     """Restart button for a container (compose-aware, stable-by-name)."""
 
+    __slots__ = (
+        "_control",
+        "_endpoint_id",
+        "_container_name",
+        "_compose_stack",
+        "_compose_service",
+        "_container",
+        "_label_cache_key",
+        "_label_cache_value",
+        "_device_info",
+        "_resolved_tick",
+        "_resolved",
+    )
+
     _attr_should_poll = False
 
     def __init__(
@@ -238,21 +288,35 @@ class PortainerContainerRestartButton(CoordinatorEntity, ButtonEntity):
 
         self._endpoint_id: int | str = container["EndpointId"]
         self._container_name: str = container["Name"]
-        self._compose_stack: str = container.get("Compose_Stack", "")
-        self._compose_service: str = container.get("Compose_Service", "")
+        self._compose_stack: str = container["Compose_Stack"]
+        self._compose_service: str = container["Compose_Service"]
 
-        self._attr_unique_id = f"{DOMAIN}_container_restart_{self._endpoint_id}_{self._container_name}"
+        self._label_cache_key: tuple | None = None
+        self._label_cache_value: str = ""
+
+        self._attr_unique_id = _UID_PREFIX + str(self._endpoint_id) + "_" + self._container_name
         self._attr_icon = "mdi:restart"
-        self._attr_name = f"Restart: {self._compute_label()}"
+        self._refresh_name()
+        self._device_info = self._build_device_info()
 
         self._container = container
+        # the container we were built from is the resolution for the current refresh
+        self._resolved_tick = getattr(coordinator, "_tick_counter", None)
+        self._resolved: dict[str, Any] | None = container
+        self._attr_available = True
 
     @property
     def available(self) -> bool:
-        return self._resolve_current_container() is not None
+        # Container presence is pushed from _handle_coordinator_update; the
+        # resolution memo survives failed refreshes, so also require the last
+        # refresh to have succeeded (Portainer unreachable -> unavailable)
+        return self.coordinator.last_update_success and self._attr_available
 
     @property
     def device_info(self):
+        return self._device_info
+
+    def _build_device_info(self):
         return container_device_info(
             self._endpoint_id,
             self._container_name,
@@ -260,46 +324,57 @@ class PortainerContainerRestartButton(CoordinatorEntity, ButtonEntity):
             self._compose_service,
         )
 
-    # naming mode
+    # naming mode (cached on the coordinator, refreshed when options change)
     def _get_name_mode(self) -> str:
-        try:
-            return self.coordinator.config_entry.options.get(
-                CONF_CONTAINER_SENSOR_NAME_MODE, DEFAULT_CONTAINER_SENSOR_NAME_MODE
-            )
-        except Exception:
-            return DEFAULT_CONTAINER_SENSOR_NAME_MODE
+        return self.coordinator.container_name_mode
+
+    def _refresh_name(self) -> None:
+        """Rebuild the entity name only when the label inputs changed."""
+        key = self._label_cache_key
+        label = self._compute_label()
+        if self._label_cache_key is not key:
+            self._attr_name = f"Restart: {label}"
 
     def _compute_label(self) -> str:
         mode = self._get_name_mode()
-        service = (self._compose_service or "").strip()
-        stack = (self._compose_stack or "").strip()
+        key = (mode, self._compose_service, self._compose_stack, self._container_name)
+        if key == self._label_cache_key:
+            return self._label_cache_value
+
+        # compose fields arrive stripped from the coordinator
+        label = _LABEL_FNS.get(mode, _label_container)(
+            self._compose_service, self._compose_stack, self._container_name
+        )
 
-        if mode == NAME_MODE_SERVICE:
-            return service or self._container_name
-        if mode == NAME_MODE_STACK_SERVICE:
-            if service and stack:
-                return f"{stack}/{service}"
-            return self._container_name
-        return self._container_name
+        self._label_cache_key = key
+        self._label_cache_value = label
+        return label
 
     def _resolve_current_container(self) -> dict[str, Any] | None:
-        containers_by_name = self.coordinator.raw_data.get("containers_by_name", {}) or {}
-        key = f"{self._endpoint_id}:{self._container_name}"
-        found = containers_by_name.get(key)
+        tick = getattr(self.coordinator, "_tick_counter", None)
+        if tick is not None and tick == self._resolved_tick:
+            return self._resolved
+        self._resolved = self._lookup_current_container()
+        self._resolved_tick = tick
+        return self._resolved
+
+    def _lookup_current_container(self) -> dict[str, Any] | None:
+        raw = self.coordinator.raw_data
+        # both indexes are always initialised by the coordinator
+        found = raw["containers_by_name"].get(f"{self._endpoint_id}:{self._container_name}")
         if found:
             return found
         if self._compose_stack or self._compose_service:
-            for cand in containers_by_name.values():
-                if (
-                    cand.get("EndpointId") == self._endpoint_id
-                    and cand.get("Compose_Stack") == self._compose_stack
-                    and cand.get("Compose_Service") == self._compose_service
-                ):
-                    new_name = cand.get("Name")
-                    if new_name and new_name != self._container_name:
-                        self._container_name = new_name
-                        self._attr_name = f"Restart: {self._compute_label()}"
-                    return cand
+            cand = raw["containers_by_compose"].get(
+                (self._endpoint_id, self._compose_stack, self._compose_service)
+            )
+            if cand is not None:
+                new_name = cand["Name"]
+                if new_name and new_name != self._container_name:
+                    self._container_name = new_name
+                    self._refresh_name()
+                    self._device_info = self._build_device_info()
+                return cand
         return None
 
     async def async_press(self) -> None:
@@ -312,20 +387,23 @@ class PortainerContainerRestartButton(CoordinatorEntity, ButtonEntity):
             )
             return
 
-        await self.hass.async_add_executor_job(
-            self._control.restart_container, self._endpoint_id, current["Id"]
-        )
-        # Immediate refresh, then a delayed refresh via async callback (thread-safe)
+        await self._control.async_restart_container(self._endpoint_id, current["Id"])
+        # Immediate refresh, then a debounced follow-up once the container has settled
         await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_post_action_refresh()
 
-        async def _refresh_later(_now) -> None:  # runs on event loop
-            await self.coordinator.async_request_refresh()
-
-        async_call_later(self.hass, 2.0, _refresh_later)
+    async def async_will_remove_from_hass(self) -> None:
+        await super().async_will_remove_from_hass()
+        # Drop per-entry objects so a removed button can't pin them across reloads
+        self._control = None
+        self._container = {}
+        self._resolved = None
+        self._resolved_tick = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         updated = self._resolve_current_container()
+        self._attr_available = updated is not None
         self._container = updated or {}
-        self._attr_name = f"Restart: {self._compute_label()}"
+        self._refresh_name()
         super()._handle_coordinator_update()
@@ -48,26 +48,49 @@ from .const import (
 
 _LOGGER = getLogger(__name__)
 
+# Labeled dropdown for container entity naming across **sensors, switches, and restart buttons**
+_NAME_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=[
+            SelectOptionDict(
+                value=NAME_MODE_SERVICE,
+                label="Compose service (shortest, e.g. 'web')",
+            ),
+            SelectOptionDict(
+                value=NAME_MODE_CONTAINER,
+                label="Container name (e.g. 'my_container')",
+            ),
+            SelectOptionDict(
+                value=NAME_MODE_STACK_SERVICE,
+                label="Stack/Service (e.g. 'myapp/web')",
+            ),
+        ],
+        multiple=False,
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+
+# (option key, default, validator) in form order
+_OPTIONS_SCHEMA_FIELDS = (
+    (CONF_FEATURE_HEALTH_CHECK, DEFAULT_FEATURE_HEALTH_CHECK, bool),
+    (CONF_FEATURE_RESTART_POLICY, DEFAULT_FEATURE_RESTART_POLICY, bool),
+    (CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK, bool),
+    (CONF_UPDATE_CHECK_TIME, DEFAULT_UPDATE_CHECK_TIME, str),
+    (CONF_CONTAINER_SENSOR_NAME_MODE, DEFAULT_CONTAINER_SENSOR_NAME_MODE, _NAME_SELECTOR),
+)
+
+# HH:MM (or H:M); the groups already bound hours to 0-23 and minutes to 0-59
+_TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]?\d)$")
+
 
 def validate_time_string(value):
     """Validate time string in HH:MM format."""
     if not isinstance(value, str):
         raise vol.Invalid("Time must be a string in HH:MM format")
 
-    time_pattern = re.compile(r"^([01]?\d|2[0-3]):([0-5]?\d)$")
-    match = time_pattern.match(value)
-
-    if not match:
+    if not _TIME_RE.match(value):
         raise vol.Invalid("Time must be in HH:MM format (e.g., 04:30)")
 
-    hours = int(match.group(1))
-    minutes = int(match.group(2))
-
-    if not (0 <= hours <= 23):
-        raise vol.Invalid("Hours must be between 0 and 23")
-    if not (0 <= minutes <= 59):
-        raise vol.Invalid("Minutes must be between 0 and 59")
-
     return value
 
 
@@ -161,10 +184,7 @@ class PortainerOptionsFlow(config_entries.OptionsFlow):
             # Validate update time only when feature enabled
             if user_input.get(CONF_FEATURE_UPDATE_CHECK) and CONF_UPDATE_CHECK_TIME in user_input:
                 time_str = user_input[CONF_UPDATE_CHECK_TIME]
-                try:
-                    import time
-                    time.strptime(time_str, "%H:%M")
-                except ValueError:
+                if not isinstance(time_str, str) or not _TIME_RE.match(time_str):
                     errors[CONF_UPDATE_CHECK_TIME] = "invalid_time_format"
 
             if not errors:
@@ -177,51 +197,9 @@ class PortainerOptionsFlow(config_entries.OptionsFlow):
 
     async def _show_form_with_static_schema(self, data, errors=None):
         """Show form with static schema - all fields visible."""
-        # Labeled dropdown for container entity naming across **sensors, switches, and restart buttons**
-        name_selector = SelectSelector(
-            SelectSelectorConfig(
-                options=[
-                    SelectOptionDict(
-                        value=NAME_MODE_SERVICE,
-                        label="Compose service (shortest, e.g. 'web')",
-                    ),
-                    SelectOptionDict(
-                        value=NAME_MODE_CONTAINER,
-                        label="Container name (e.g. 'my_container')",
-                    ),
-                    SelectOptionDict(
-                        value=NAME_MODE_STACK_SERVICE,
-                        label="Stack/Service (e.g. 'myapp/web')",
-                    ),
-                ],
-                multiple=False,
-                mode=SelectSelectorMode.DROPDOWN,
-            )
-        )
-
         schema_dict = {
-            vol.Optional(
-                CONF_FEATURE_HEALTH_CHECK,
-                default=data.get(CONF_FEATURE_HEALTH_CHECK, DEFAULT_FEATURE_HEALTH_CHECK),
-            ): bool,
-            vol.Optional(
-                CONF_FEATURE_RESTART_POLICY,
-                default=data.get(CONF_FEATURE_RESTART_POLICY, DEFAULT_FEATURE_RESTART_POLICY),
-            ): bool,
-            vol.Optional(
-                CONF_FEATURE_UPDATE_CHECK,
-                default=data.get(CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK),
-            ): bool,
-            vol.Optional(
-                CONF_UPDATE_CHECK_TIME,
-                default=data.get(CONF_UPDATE_CHECK_TIME, DEFAULT_UPDATE_CHECK_TIME),
-            ): str,
-            vol.Optional(
-                CONF_CONTAINER_SENSOR_NAME_MODE,
-                default=data.get(
-                    CONF_CONTAINER_SENSOR_NAME_MODE, DEFAULT_CONTAINER_SENSOR_NAME_MODE
-                ),
-            ): name_selector,
+            vol.Optional(key, default=data.get(key, default)): validator
+            for key, default, validator in _OPTIONS_SCHEMA_FIELDS
         }
 
         return self.async_show_form(
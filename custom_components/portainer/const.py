@@ -16,6 +16,7 @@ DEFAULT_NAME = "root"
 ATTRIBUTION = "Data provided by Portainer integration"
 
 SCAN_INTERVAL = 30
+POST_ACTION_REFRESH_DELAY = 2.0  # seconds; debounced follow-up refresh after button actions
 
 DEFAULT_HOST = "portainer:9443"
 
@@ -46,8 +47,26 @@ HTTP_READ_TIMEOUT: int = 10              # seconds
 # Retry policy for transient errors
 HTTP_RETRIES_TOTAL: int = 2
 HTTP_BACKOFF_FACTOR: float = 0.5
+HTTP_BACKOFF_JITTER: float = 0.5         # seconds of random spread per retry (urllib3 >= 2)
 HTTP_STATUS_FORCELIST: tuple[int, ...] = (429, 500, 502, 503, 504)
 
+# Response cache TTL (seconds) per exact GET service path; unlisted = no cache.
+# Container listings stay uncached so switch/state entities never go stale;
+# endpoints too, since they carry Status/snapshots and drive connected().
+HTTP_CACHE_TTL: dict[str, int] = {
+    "stacks": 60,
+}
+
+# GET services that use ETag conditional requests ("{}" = endpoint id). Per-container
+# paths (inspect) stay out: their ids churn and each entry pins a parsed body.
+HTTP_ETAG_SERVICES: tuple[str, ...] = (
+    "endpoints",
+    "stacks",
+    "endpoints/{}/docker/containers/json",
+    "endpoints/{}/docker/images/json",
+    "endpoints/{}/docker/info",
+)
+
 
 
 # sensor naming mode
@@ -63,6 +82,9 @@ DEFAULT_CONTAINER_SENSOR_NAME_MODE = NAME_MODE_SERVICE
 # Stats concurrency
 STATS_MAX_CONCURRENCY: int = 32
 
+# Container inspects in flight per refresh; each holds a slot in HA's shared executor
+INSPECT_MAX_CONCURRENCY: int = 8
+
 
 # Stats polling options (stored in ConfigEntry.options)
 CONF_STATS_SCAN_INTERVAL: str = "stats_scan_interval"
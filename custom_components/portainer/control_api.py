@@ -2,6 +2,8 @@
 
 Thin, robust wrappers around Portainer actions (containers & stacks).
 - Uses direct POSTs to handle 2xx (incl. 204 No Content) without depending on api.py semantics.
+- POSTs run on the event loop via HA's shared aiohttp session (pooled keep-alive, no retries,
+  so an action is never sent twice).
 - Stacks use: /stacks/{stack_id}/start|stop?endpointId={endpoint_id}
 """
 from __future__ import annotations
@@ -9,52 +11,58 @@ from __future__ import annotations
 from logging import getLogger
 from typing import Any
 
-from requests import post as requests_post
+import aiohttp
 
 from .api import PortainerAPI
+from .const import HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
 
 _LOGGER = getLogger(__name__)
 
+# Same (connect, read) split as the requests path
+_ACTION_TIMEOUT = aiohttp.ClientTimeout(connect=HTTP_CONNECT_TIMEOUT, sock_read=HTTP_READ_TIMEOUT)
+
 
 class PortainerControl:
     """Control helpers for Portainer resources."""
 
     def __init__(self, api: PortainerAPI) -> None:
         # Uses API's connection details; avoids API.query() to properly treat 204.
+        self._api = api
         self._url = api._url  # noqa: SLF001
         self._api_key = api._api_key  # noqa: SLF001
         self._ssl_verify = api._ssl_verify  # noqa: SLF001
+        self._headers = {
+            "X-API-Key": self._api_key,
+            "Content-Type": "application/json",
+        }
 
     # ---------------------------
     # internals
     # ---------------------------
-    def _post_action(self, service: str, body: dict[str, Any] | None = None) -> bool:
+    async def _async_post_action(self, service: str, body: dict[str, Any] | None = None) -> bool:
         """POST to Portainer and treat any 2xx as success.
         Why empty JSON: Portainer stack start expects a JSON payload; `{}` works.
         """
         url = f"{self._url}{service}"
-        headers = {
-            "X-API-Key": self._api_key,
-            "Content-Type": "application/json",
-        }
         try:
-            response = requests_post(
+            session = self._api._client_session()  # noqa: SLF001
+            # Same gate as stats: together they never outnumber pooled sockets
+            async with self._api.http_slots(), session.post(
                 url,
-                headers=headers,
+                headers=self._headers,
                 json=body if body is not None else {},
-                verify=self._ssl_verify,
-                timeout=10,
-            )
-            if 200 <= response.status_code < 300:
-                _LOGGER.debug("Portainer action ok: %s (status %s)", service, response.status_code)
-                return True
-            _LOGGER.warning(
-                "Portainer action failed: %s (status %s, body=%s)",
-                service,
-                response.status_code,
-                response.text,
-            )
-            return False
+                timeout=_ACTION_TIMEOUT,
+            ) as response:
+                if 200 <= response.status < 300:
+                    _LOGGER.debug("Portainer action ok: %s (status %s)", service, response.status)
+                    return True
+                _LOGGER.warning(
+                    "Portainer action failed: %s (status %s, body=%s)",
+                    service,
+                    response.status,
+                    await response.text(),
+                )
+                return False
         except Exception as ex:  # noqa: BLE001
             _LOGGER.warning("Portainer action exception: %s (%s)", service, ex)
             return False
@@ -62,27 +70,34 @@ class PortainerControl:
     # ---------------------------
     # container actions
     # ---------------------------
-    def start_container(self, endpoint_id: int, container_id: str) -> bool:
-        return self._post_action(
+    async def async_start_container(self, endpoint_id: int, container_id: str) -> bool:
+        return await self._async_post_action(
             f"endpoints/{endpoint_id}/docker/containers/{container_id}/start"
         )
 
-    def stop_container(self, endpoint_id: int, container_id: str) -> bool:
-        return self._post_action(
+    async def async_stop_container(self, endpoint_id: int, container_id: str) -> bool:
+        return await self._async_post_action(
             f"endpoints/{endpoint_id}/docker/containers/{container_id}/stop"
         )
 
-    def restart_container(self, endpoint_id: int, container_id: str) -> bool:
-        return self._post_action(
+    async def async_restart_container(self, endpoint_id: int, container_id: str) -> bool:
+        return await self._async_post_action(
             f"endpoints/{endpoint_id}/docker/containers/{container_id}/restart"
         )
 
     # ---------------------------
     # stack actions
     # ---------------------------
-    def start_stack(self, endpoint_id: int, stack_id: int) -> bool:
+    async def async_start_stack(self, endpoint_id: int, stack_id: int) -> bool:
         # Portainer requires endpointId query on /stacks
-        return self._post_action(f"stacks/{stack_id}/start?endpointId={endpoint_id}")
+        return await self._async_stack_action(f"stacks/{stack_id}/start?endpointId={endpoint_id}")
+
+    async def async_stop_stack(self, endpoint_id: int, stack_id: int) -> bool:
+        return await self._async_stack_action(f"stacks/{stack_id}/stop?endpointId={endpoint_id}")
 
-    def stop_stack(self, endpoint_id: int, stack_id: int) -> bool:
-        return self._post_action(f"stacks/{stack_id}/stop?endpointId={endpoint_id}")
+    async def _async_stack_action(self, service: str) -> bool:
+        ok = await self._async_post_action(service)
+        if ok:
+            # Next refresh must see the new stack state, not the cached list
+            self._api.invalidate_cache("stacks")
+        return ok
@@ -3,10 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from datetime import timedelta
 from dataclasses import dataclass
-from functools import partial
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -17,6 +17,7 @@ from homeassistant.const import (
     CONF_VERIFY_SSL,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -24,14 +25,18 @@ from homeassistant.util import dt as dt_util
 from .api import PortainerAPI
 from .apiparser import parse_api
 from .const import (
+    CONF_CONTAINER_SENSOR_NAME_MODE,
     CONF_FEATURE_HEALTH_CHECK,  # feature switch
     CONF_FEATURE_RESTART_POLICY,
     CONF_FEATURE_UPDATE_CHECK,
     CUSTOM_ATTRIBUTE_ARRAY,
+    DEFAULT_CONTAINER_SENSOR_NAME_MODE,
     DEFAULT_FEATURE_HEALTH_CHECK,
     DEFAULT_FEATURE_RESTART_POLICY,
     DEFAULT_FEATURE_UPDATE_CHECK,
     DOMAIN,
+    INSPECT_MAX_CONCURRENCY,
+    POST_ACTION_REFRESH_DELAY,
     SCAN_INTERVAL,
     # --- stats options ---
     CONF_STATS_SCAN_INTERVAL,
@@ -45,8 +50,13 @@ from .portainer_update_service import PortainerUpdateService
 
 _LOGGER = logging.getLogger(__name__)
 
-TRANSLATION_UPDATE_CHECK_STATUS_STATE = (
-    "component.portainer.entity.sensor.update_check_status.state"
+# Shared read-only default for nested .get() chains; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+# Container inspect fields per feature switch; the update check has its own path
+_INSPECT_VALS = (
+    (CONF_FEATURE_HEALTH_CHECK, {"name": "Health_Status", "source": "State/Health/Status", "default": "unknown"}),
+    (CONF_FEATURE_RESTART_POLICY, {"name": "Restart_Policy", "source": "HostConfig/RestartPolicy/Name", "default": "unknown"}),
 )
 
 
@@ -67,17 +77,13 @@ class PortainerCoordinator(DataUpdateCoordinator):
         self.host = config_entry.data[CONF_HOST]
         self.config_entry_id = config_entry.entry_id
 
-        self.features = {
-            CONF_FEATURE_HEALTH_CHECK: config_entry.options.get(
-                CONF_FEATURE_HEALTH_CHECK, DEFAULT_FEATURE_HEALTH_CHECK
-            ),
-            CONF_FEATURE_RESTART_POLICY: config_entry.options.get(
-                CONF_FEATURE_RESTART_POLICY, DEFAULT_FEATURE_RESTART_POLICY
-            ),
-            CONF_FEATURE_UPDATE_CHECK: config_entry.options.get(
-                CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK
-            ),
-        }
+        # Shared by reference with the update service; always update in place
+        self.features: dict[str, bool] = {}
+        self._update_features(config_entry.options)
+        # read once here; entities use it instead of hitting options per refresh
+        self.container_name_mode: str = config_entry.options.get(
+            CONF_CONTAINER_SENSOR_NAME_MODE, DEFAULT_CONTAINER_SENSOR_NAME_MODE
+        )
 
         self.api = PortainerAPI(
             self.hass,
@@ -91,46 +97,71 @@ class PortainerCoordinator(DataUpdateCoordinator):
             hass, config_entry, self.api, self.features, self.config_entry_id
         )
 
-        self.raw_data: dict[str, dict] = {
-            "endpoints": {},
-            "containers": {},         # flattened by container ID (legacy)
-            "containers_by_name": {}, # flattened by endpoint+name
-            "stacks": {},
-        }
+        self.raw_data: dict[str, dict] = self._empty_raw_data()
+        # bumped once per completed refresh; lets entities memoize per-refresh lookups
+        self._tick_counter = 0
+        # containers_by_name keys that appeared in the latest completed refresh
+        self.new_container_keys: frozenset[str] = frozenset()
+        self._known_container_keys: frozenset[str] = frozenset()
+        # endpoint ids with Status == 1; set by get_endpoints each refresh
+        self._online_endpoints: frozenset = frozenset()
 
         self.lock = asyncio.Lock()
+        # Follow-up refresh after container actions; a burst of presses shares one run
+        self._post_action_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=POST_ACTION_REFRESH_DELAY,
+            immediate=False,
+            function=self.async_request_refresh,
+        )
         self.config_entry = config_entry
         self._systemstats_errored: list = []
         self.datasets_hass_device_id = None
 
         self.config_entry.async_on_unload(self.async_shutdown)
 
+    @staticmethod
+    def _empty_raw_data() -> dict[str, dict]:
+        return {
+            "endpoints": {},
+            "containers": {},         # flattened by container ID (legacy)
+            "containers_by_name": {}, # flattened by endpoint+name
+            "containers_by_compose": {}, # (endpoint, stack, service) -> container
+            "compose_stacks": frozenset(), # (endpoint, stack) with >=1 container
+            "stacks": {},
+        }
+
     @property
     def update_check_time(self):
         return self.update_service.update_check_time
 
     async def async_update_entry(self, config_entry):
         self.config_entry = config_entry
-        self.features = {
-            CONF_FEATURE_HEALTH_CHECK: config_entry.options.get(
-                CONF_FEATURE_HEALTH_CHECK, DEFAULT_FEATURE_HEALTH_CHECK
-            ),
-            CONF_FEATURE_RESTART_POLICY: config_entry.options.get(
-                CONF_FEATURE_RESTART_POLICY, DEFAULT_FEATURE_RESTART_POLICY
-            ),
-            CONF_FEATURE_UPDATE_CHECK: config_entry.options.get(
-                CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK
-            ),
-        }
-        await self.update_service.async_update_entry(config_entry)
+        self._update_features(config_entry.options)
+        self.container_name_mode = config_entry.options.get(
+            CONF_CONTAINER_SENSOR_NAME_MODE, DEFAULT_CONTAINER_SENSOR_NAME_MODE
+        )
+        self.update_service.config_entry = config_entry
         await self.async_request_refresh()
 
+    def _update_features(self, options) -> None:
+        self.features[CONF_FEATURE_HEALTH_CHECK] = options.get(
+            CONF_FEATURE_HEALTH_CHECK, DEFAULT_FEATURE_HEALTH_CHECK
+        )
+        self.features[CONF_FEATURE_RESTART_POLICY] = options.get(
+            CONF_FEATURE_RESTART_POLICY, DEFAULT_FEATURE_RESTART_POLICY
+        )
+        self.features[CONF_FEATURE_UPDATE_CHECK] = options.get(
+            CONF_FEATURE_UPDATE_CHECK, DEFAULT_FEATURE_UPDATE_CHECK
+        )
+
+    async def async_request_post_action_refresh(self) -> None:
+        """Schedule the (debounced) follow-up refresh after a container action."""
+        await self._post_action_debouncer.async_call()
+
     async def async_shutdown(self) -> None:
-        if self.lock.locked():
-            try:
-                self.lock.release()
-            except RuntimeError:
-                pass
+        self._post_action_debouncer.async_cancel()
         try:
             self.api.close()
         except Exception:
@@ -140,23 +171,34 @@ class PortainerCoordinator(DataUpdateCoordinator):
         return self.api.connected()
 
     async def _async_update_data(self) -> dict[str, dict]:
-        try:
-            await asyncio.wait_for(self.lock.acquire(), timeout=10)
-        except asyncio.TimeoutError:
-            return {}
-        try:
-            self.raw_data = {}
-            await self.hass.async_add_executor_job(self.get_endpoints)
-            await self.hass.async_add_executor_job(self.get_containers)
-            await self.hass.async_add_executor_job(self.get_stacks)
-            await self.hass.async_add_executor_job(self.get_system_data)
-        except Exception as error:  # noqa: BLE001
-            self.lock.release()
-            raise UpdateFailed(error) from error
-        self.lock.release()
-
-        _LOGGER.debug("data: %s", self.raw_data)
-        async_dispatcher_send(self.hass, f"{self.config_entry.entry_id}_update", self)
+        # Serialises overlapping refreshes (scheduled + requested); released on any exit
+        async with self.lock:
+            try:
+                self.raw_data = self._empty_raw_data()
+                await self.hass.async_add_executor_job(self.get_endpoints)
+                # The stacks listing only needs endpoints; fetch it while containers load
+                stacks_map, _ = await asyncio.gather(
+                    self.hass.async_add_executor_job(self._fetch_stacks),
+                    self._async_get_containers(),
+                )
+                # Synthetic-stack fallback and system data read the container results
+                await self.hass.async_add_executor_job(self.get_stacks, stacks_map)
+                await self.hass.async_add_executor_job(self.get_system_data)
+            except Exception as error:  # noqa: BLE001
+                raise UpdateFailed(error) from error
+
+        self._tick_counter += 1
+        self._diff_container_keys()
+        # Payload: (coordinator, new containers_by_name keys, containers_by_name)
+        async_dispatcher_send(
+            self.hass,
+            f"{self.config_entry.entry_id}_update",
+            self,
+            self.new_container_keys,
+            self.raw_data["containers_by_name"],
+        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("data: %s", self.raw_data)
         return self.raw_data
 
     def get_system_data(self) -> None:
@@ -176,9 +218,11 @@ class PortainerCoordinator(DataUpdateCoordinator):
             ),
         }
         self.raw_data["system"] = system_data
-        _LOGGER.debug("System data created: %s", system_data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("System data created: %s", system_data)
 
     def get_endpoints(self) -> None:
+        self._online_endpoints = frozenset()
         self.raw_data["endpoints"] = parse_api(
             data={},
             source=self.api.query("endpoints"),
@@ -214,51 +258,116 @@ class PortainerCoordinator(DataUpdateCoordinator):
                 ],
             )
             del self.raw_data["endpoints"][eid]["Snapshots"]
+        self._online_endpoints = frozenset(
+            eid for eid, endpoint in self.raw_data["endpoints"].items() if endpoint["Status"] == 1
+        )
+
+    async def _async_get_containers(self) -> None:
+        await self._async_fetch_containers()
+        inspect_vals = [val for feature, val in _INSPECT_VALS if self.features[feature]]
+        if inspect_vals:
+            await self._async_fetch_inspects(inspect_vals)
+        await self.hass.async_add_executor_job(self.get_containers)
+
+    async def _async_fetch_containers(self) -> None:
+        """List containers of every online endpoint concurrently (one executor job each)."""
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                eid: tg.create_task(
+                    self.hass.async_add_executor_job(self._parse_containers_for_endpoint, eid)
+                )
+                for eid in self._online_endpoints
+            }
+        self.raw_data["containers"] = {eid: task.result() for eid, task in tasks.items()}
+
+    async def _async_fetch_inspects(self, vals: list[dict]) -> None:
+        """Inspect every listed container concurrently, storing `vals` as its custom attributes."""
+        containers = self.raw_data["containers"]
+        keys = [(eid, cid) for eid, by_id in containers.items() for cid in by_id]
+        # Bounded: hundreds of containers must not flood the shared executor or the HTTP pool
+        sem = asyncio.Semaphore(INSPECT_MAX_CONCURRENCY)
+
+        async def _inspect(eid: str, cid: str) -> dict:
+            async with sem:
+                return await self.hass.async_add_executor_job(
+                    self._parse_container_inspect, eid, cid, vals
+                )
+
+        results = await asyncio.gather(*(_inspect(eid, cid) for eid, cid in keys))
+        for (eid, cid), inspect in zip(keys, results):
+            containers[eid][cid][CUSTOM_ATTRIBUTE_ARRAY] = inspect
+
+    def _parse_container_inspect(self, eid: str, cid: str, vals: list[dict]) -> dict:
+        return parse_api(
+            data={},
+            source=self.api.query(
+                f"endpoints/{eid}/docker/containers/{cid}/json",
+                "get",
+                {"all": True},
+            ),
+            vals=vals,
+        )
 
     def get_containers(self) -> None:
-        self.raw_data["containers"] = {}
+        """Enrich + index the listings fetched by _async_fetch_containers."""
         registry_checked = False
+        # Health/restart-policy attributes were filled by _async_fetch_inspects
+        update_check = self.features[CONF_FEATURE_UPDATE_CHECK]
 
-        for eid in self.raw_data["endpoints"]:
-            if self.raw_data["endpoints"][eid]["Status"] != 1:
-                continue
-            self.raw_data["containers"][eid] = self._parse_containers_for_endpoint(eid)
+        for eid in self.raw_data["containers"]:
             self._set_container_environment_and_config(eid)
-            if self._custom_features_enabled():
+            if update_check:
                 registry_checked = self._handle_custom_features_for_endpoint(
                     eid, registry_checked
                 )
 
-        # legacy: flattened by container ID
-        flat_by_id = self._flatten_containers_dict_by_id(self.raw_data["containers"])
-        self.raw_data["containers"] = flat_by_id
-
-        # NEW: stable index by endpoint+name
-        self.raw_data["containers_by_name"] = self._index_containers_by_name(flat_by_id)
+        (
+            self.raw_data["containers"],
+            self.raw_data["containers_by_name"],
+            self.raw_data["containers_by_compose"],
+        ) = self._flatten_and_index_containers(self.raw_data["containers"])
+        self.raw_data["compose_stacks"] = frozenset(
+            (eid, stack) for eid, stack, _service in self.raw_data["containers_by_compose"] if stack
+        )
 
         if registry_checked:
             self.last_update_check = dt_util.now()
 
-    def _flatten_containers_dict_by_id(self, containers: dict) -> dict:
-        """Flatten containers dict; each environment has its set of containers by ID."""
-        return {
-            f"{eid}{cid}": value
-            for eid, t_dict in containers.items()
-            for cid, value in t_dict.items()
-        }
+    def _diff_container_keys(self) -> None:
+        """Record which containers_by_name keys are new since the last completed refresh.
 
-    def _index_containers_by_name(self, flat_by_id: dict) -> dict:
-        """Return mapping keyed by f"{EndpointId}:{Name}" -> container dict.
-        Provides a stable handle across container recreations.
+        Done only for refreshes that reach the dispatcher, so listeners see every
+        new key exactly once even if an intermediate refresh failed.
         """
-        index: dict[str, dict] = {}
-        for c in flat_by_id.values():
-            eid = c.get("EndpointId")
-            name = c.get("Name")
-            if eid is None or not name:
-                continue
-            index[f"{eid}:{name}"] = c
-        return index
+        keys = frozenset(self.raw_data["containers_by_name"])
+        self.new_container_keys = keys - self._known_container_keys
+        self._known_container_keys = keys
+
+    def _flatten_and_index_containers(self, containers: dict) -> tuple[dict, dict, dict]:
+        """Flatten {eid: {cid: container}} and build the lookup indexes in one pass.
+
+        Returns (flat_by_id, by_name, by_compose):
+          - flat_by_id: f"{eid}{cid}" -> container (legacy)
+          - by_name: f"{EndpointId}:{Name}" -> container; stable across recreations
+          - by_compose: (EndpointId, Compose_Stack, Compose_Service) -> container; lets
+            entities follow a compose service across renames without scanning
+        """
+        flat_by_id: dict[str, dict] = {}
+        by_name: dict[str, dict] = {}
+        by_compose: dict[tuple, dict] = {}
+        for eid, t_dict in containers.items():
+            for cid, c in t_dict.items():
+                flat_by_id[f"{eid}{cid}"] = c
+                c_eid = c.get("EndpointId")
+                name = c.get("Name")
+                if c_eid is not None and name:
+                    by_name[f"{c_eid}:{name}"] = c
+                stack = c.get("Compose_Stack")
+                service = c.get("Compose_Service")
+                if stack or service:
+                    # first match wins, like the linear scan this replaced
+                    by_compose.setdefault((c_eid, stack, service), c)
+        return flat_by_id, by_name, by_compose
 
     def _parse_containers_for_endpoint(self, eid: str) -> dict:
         return parse_api(
@@ -291,75 +400,26 @@ class PortainerCoordinator(DataUpdateCoordinator):
             container = self.raw_data["containers"][eid][cid]
             container["Environment"] = self.raw_data["endpoints"][eid]["Name"]
             container["Name"] = container["Names"][0][1:]
+            # Normalise once here so entities can use compose labels as-is; interned
+            # because every container of a stack repeats the same strings
+            container["Compose_Stack"] = sys.intern(container["Compose_Stack"].strip())
+            container["Compose_Service"] = sys.intern(container["Compose_Service"].strip())
             container["ConfigEntryId"] = self.config_entry_id
-            container[CUSTOM_ATTRIBUTE_ARRAY] = {}
-
-    def _custom_features_enabled(self) -> bool:
-        return (
-            self.features[CONF_FEATURE_HEALTH_CHECK]
-            or self.features[CONF_FEATURE_RESTART_POLICY]
-            or self.features[CONF_FEATURE_UPDATE_CHECK]
-        )
+            # already filled by _async_fetch_inspects when an inspect feature is on
+            container[CUSTOM_ATTRIBUTE_ARRAY] = container[CUSTOM_ATTRIBUTE_ARRAY] or {}
 
     def _handle_custom_features_for_endpoint(self, eid: str, registry_checked: bool) -> bool:
-        for cid in self.raw_data["containers"][eid]:
-            container = self.raw_data["containers"][eid][cid]
-            container[CUSTOM_ATTRIBUTE_ARRAY + "_Raw"] = parse_api(
-                data={},
-                source=self.api.query(
-                    f"endpoints/{eid}/docker/containers/{cid}/json",
-                    "get",
-                    {"all": True},
-                ),
-                vals=[
-                    {"name": "Health_Status", "source": "State/Health/Status", "default": "unknown"},
-                    {"name": "Restart_Policy", "source": "HostConfig/RestartPolicy/Name", "default": "unknown"},
-                ],
-                ensure_vals=[
-                    {"name": "Health_Status", "default": "unknown"},
-                    {"name": "Restart_Policy", "default": "unknown"},
-                ],
-            )
-            if self.features[CONF_FEATURE_HEALTH_CHECK]:
-                container[CUSTOM_ATTRIBUTE_ARRAY]["Health_Status"] = container[CUSTOM_ATTRIBUTE_ARRAY + "_Raw"]["Health_Status"]
-            if self.features[CONF_FEATURE_RESTART_POLICY]:
-                container[CUSTOM_ATTRIBUTE_ARRAY]["Restart_Policy"] = container[CUSTOM_ATTRIBUTE_ARRAY + "_Raw"]["Restart_Policy"]
-            if self.features[CONF_FEATURE_UPDATE_CHECK]:
-                update_available = self.update_service.check_image_updates(eid, container)
-                if update_available["registry_used"]:
-                    registry_checked = True
-                container[CUSTOM_ATTRIBUTE_ARRAY]["Update_Available"] = update_available["status"]
-                container[CUSTOM_ATTRIBUTE_ARRAY]["Update_Description"] = update_available["status_description"]
-            del container[CUSTOM_ATTRIBUTE_ARRAY + "_Raw"]
+        """Apply the image update check to every container of an endpoint."""
+        check_image_updates = self.update_service.check_image_updates
+        for container in self.raw_data["containers"][eid].values():
+            update_available = check_image_updates(eid, container)
+            if update_available["registry_used"]:
+                registry_checked = True
+            custom = container[CUSTOM_ATTRIBUTE_ARRAY]
+            custom["Update_Available"] = update_available["status"]
+            custom["Update_Description"] = update_available["status_description"]
         return registry_checked
 
-    def _get_update_description(self, status, registry_name=None, translations=None):
-        desc_key = f"update_status_{status}"
-        if translations is None:
-            translations = getattr(self.hass, "translations", {})
-        if (
-            translations
-            and TRANSLATION_UPDATE_CHECK_STATUS_STATE in translations
-            and desc_key in translations[TRANSLATION_UPDATE_CHECK_STATUS_STATE]
-        ):
-            text = translations[TRANSLATION_UPDATE_CHECK_STATUS_STATE][desc_key]
-            if "{registry}" in text and registry_name:  # NOSONAR
-                return text.replace("{registry}", registry_name)
-            return text
-        default_map = {
-            0: "No update available.",
-            1: "Update available!",
-            2: "Update status not yet checked.",
-            401: "Unauthorized (registry credentials required or invalid) for registry {registry}.",
-            404: "Image not found on registry ({registry}).",
-            429: "Registry rate limit reached.",
-            500: "Registry/internal error.",
-        }
-        text = default_map.get(status, f"Status code: {status}")
-        if "{registry}" in text and registry_name:
-            return text.replace("{registry}", registry_name)
-        return text
-
     def should_check_updates(self) -> bool:
         return self.update_service.should_check_updates()
 
@@ -386,13 +446,11 @@ class PortainerCoordinator(DataUpdateCoordinator):
     # ---------------------------
     # stacks
     # ---------------------------
-    def get_stacks(self) -> None:
-        """Fetch stacks and store in raw_data['stacks'] keyed by f"{endpoint_id}:{stack_id}"."""
-        self.raw_data["stacks"] = {}
+    def _fetch_stacks(self) -> dict:
+        """Query the stacks listing; independent of containers so it can run alongside them."""
         if not self.raw_data.get("endpoints"):
-            return
-
-        stacks_map = parse_api(
+            return {}
+        return parse_api(
             data={},
             source=self.api.query("stacks"),
             key="Id",
@@ -404,6 +462,12 @@ class PortainerCoordinator(DataUpdateCoordinator):
             ],
         )
 
+    def get_stacks(self, stacks_map: dict) -> None:
+        """Store stacks from _fetch_stacks in raw_data['stacks'] keyed by f"{endpoint_id}:{stack_id}"."""
+        self.raw_data["stacks"] = {}
+        if not self.raw_data.get("endpoints"):
+            return
+
         # If API yields nothing, build from compose labels as fallback
         if not stacks_map:
             _LOGGER.info(
@@ -412,9 +476,7 @@ class PortainerCoordinator(DataUpdateCoordinator):
             self.raw_data["stacks"] = self._fallback_stacks_from_containers()
             return
 
-        online_endpoints = {
-            eid for eid, e in self.raw_data["endpoints"].items() if e.get("Status") == 1
-        }
+        online_endpoints = self._online_endpoints
         grouped: dict[int | str, dict] = {}
         for sid, stack in stacks_map.items():
             eid = stack.get("EndpointId")
@@ -453,20 +515,21 @@ class PortainerCoordinator(DataUpdateCoordinator):
           - Name: <Compose_Stack>
         """
         result: dict[str, dict] = {}
-        flat = self.raw_data.get("containers", {}) or {}
+        flat = self.raw_data["containers"]
         if not flat:
             return result
 
+        endpoints = self.raw_data["endpoints"]
         for c in flat.values():
             eid = c.get("EndpointId")
-            stack_name = (c.get("Compose_Stack") or "").strip()
+            stack_name = c.get("Compose_Stack")  # already stripped during enrichment
             if not eid or not stack_name:
                 continue
             synth_id = f"synth-{eid}:{stack_name}"
             key = f"{eid}:{synth_id}"
             if key in result:
                 continue
-            endpoint = (self.raw_data.get("endpoints") or {}).get(eid) or {}
+            endpoint = endpoints.get(eid, _EMPTY)
             result[key] = {
                 "Id": synth_id,
                 "Name": stack_name,
@@ -483,30 +546,22 @@ class PortainerCoordinator(DataUpdateCoordinator):
 # Per-container stats coordinator (CPU% / Memory), cached by container
 # ===================================================================
 
-def _safe_get(dct: Dict[str, Any], *path: str, default: Any | None = None) -> Any:
-    cur: Any = dct
-    for key in path:
-        if not isinstance(cur, dict):
-            return default
-        cur = cur.get(key)
-        if cur is None:
-            return default
-    return cur
-
-
 def compute_cpu_percent(stats: Dict[str, Any]) -> float:
     """Docker CPU% formula; returns 0.0 when data is insufficient."""
-    cpu_total = _safe_get(stats, "cpu_stats", "cpu_usage", "total_usage", default=0) or 0
-    precpu_total = _safe_get(stats, "precpu_stats", "cpu_usage", "total_usage", default=0) or 0
-    system_cpu = _safe_get(stats, "cpu_stats", "system_cpu_usage", default=0) or 0
-    pre_system_cpu = _safe_get(stats, "precpu_stats", "system_cpu_usage", default=0) or 0
-    cpu_delta = cpu_total - precpu_total
-    system_delta = system_cpu - pre_system_cpu
+    cpu_stats = stats.get("cpu_stats") or _EMPTY
+    precpu_stats = stats.get("precpu_stats") or _EMPTY
+    cpu_usage = cpu_stats.get("cpu_usage") or _EMPTY
+    cpu_delta = (cpu_usage.get("total_usage") or 0) - (
+        (precpu_stats.get("cpu_usage") or _EMPTY).get("total_usage") or 0
+    )
+    system_delta = (cpu_stats.get("system_cpu_usage") or 0) - (
+        precpu_stats.get("system_cpu_usage") or 0
+    )
     if cpu_delta <= 0 or system_delta <= 0:
         return 0.0
     online_cpus = (
-        _safe_get(stats, "cpu_stats", "online_cpus")
-        or len(_safe_get(stats, "cpu_stats", "cpu_usage", "percpu_usage", default=[]) or [])
+        cpu_stats.get("online_cpus")
+        or len(cpu_usage.get("percpu_usage") or ())
         or 1
     )
     return float((cpu_delta / system_delta) * online_cpus * 100.0)
@@ -514,17 +569,19 @@ def compute_cpu_percent(stats: Dict[str, Any]) -> float:
 
 def compute_memory_used_bytes(stats: Dict[str, Any], *, exclude_cache: bool = True) -> int:
     """Memory used; subtract cache/inactive_file when requested to reflect pressure."""
-    usage = int(_safe_get(stats, "memory_stats", "usage", default=0) or 0)
+    memory_stats = stats.get("memory_stats") or _EMPTY
+    usage = int(memory_stats.get("usage") or 0)
     if not exclude_cache:
         return max(usage, 0)
-    cache = int(_safe_get(stats, "memory_stats", "stats", "cache", default=0) or 0)
+    mem_detail = memory_stats.get("stats") or _EMPTY
+    cache = int(mem_detail.get("cache") or 0)
     if cache == 0:
-        cache = int(_safe_get(stats, "memory_stats", "stats", "inactive_file", default=0) or 0)
+        cache = int(mem_detail.get("inactive_file") or 0)
     return max(usage - cache, 0)
 
 
 def compute_memory_percent(stats: Dict[str, Any], used_bytes: int) -> float:
-    limit = int(_safe_get(stats, "memory_stats", "limit", default=0) or 0)
+    limit = int((stats.get("memory_stats") or _EMPTY).get("limit") or 0)
     if limit <= 0:
         return 0.0
     return float((used_bytes / limit) * 100.0)
@@ -560,27 +617,32 @@ class ContainerStatsCoordinator(DataUpdateCoordinator[ContainerStatsData]):
         self._endpoint_id = endpoint_id
         self._container_id = container_id
         self._container_key = container_key
-        self._alpha: float = (options or {}).get(CONF_STATS_SMOOTHING_ALPHA, DEFAULT_STATS_SMOOTHING_ALPHA)
-        self._exclude_cache: bool = (options or {}).get(CONF_MEM_EXCLUDE_CACHE, DEFAULT_MEM_EXCLUDE_CACHE)
-        interval_seconds: int = int((options or {}).get(CONF_STATS_SCAN_INTERVAL, DEFAULT_STATS_SCAN_INTERVAL))
+        opts = options or {}
+        self._alpha: float = opts.get(CONF_STATS_SMOOTHING_ALPHA, DEFAULT_STATS_SMOOTHING_ALPHA)
+        self._exclude_cache: bool = opts.get(CONF_MEM_EXCLUDE_CACHE, DEFAULT_MEM_EXCLUDE_CACHE)
+        interval_seconds: int = int(opts.get(CONF_STATS_SCAN_INTERVAL, DEFAULT_STATS_SCAN_INTERVAL))
         super().__init__(
             hass,
             logger=_LOGGER,
             name=f"{DOMAIN}_container_stats:{entry_id}:{container_key}",
             update_interval=timedelta(seconds=interval_seconds),
+            # _build_stats_data returns the previous object for an unchanged sample
+            always_update=False,
         )
         self._last_cpu: Optional[float] = None
         self._last: Optional[ContainerStatsData] = None
+        self._last_key: tuple | None = None
 
     async def _async_update_data(self) -> ContainerStatsData:
         # Fetch stats; None on per-container errors/stopped containers
-        stats: Dict[str, Any] | None = await self.hass.async_add_executor_job(
-            partial(
-                self._api.get_container_stats,
-                endpoint_id=self._endpoint_id,
-                container_id=self._container_id,
-            )
+        stats: Dict[str, Any] | None = await self._api.get_container_stats(
+            endpoint_id=self._endpoint_id,
+            container_id=self._container_id,
         )
+        return self._build_stats_data(stats)
+
+    def _build_stats_data(self, stats: Dict[str, Any] | None) -> ContainerStatsData:
+        """Turn a raw Docker stats payload into cached, smoothed values."""
         if not stats:
             # Keep last values if we have them; otherwise return zeros
             if self._last is not None:
@@ -595,12 +657,27 @@ class ContainerStatsCoordinator(DataUpdateCoordinator[ContainerStatsData]):
             self._last = zeros
             return zeros
 
+        # Docker repeats a sample until the container's cgroup counters tick over
+        cpu_stats = stats.get("cpu_stats") or _EMPTY
+        memory_stats = stats.get("memory_stats") or _EMPTY
+        key = (
+            (cpu_stats.get("cpu_usage") or _EMPTY).get("total_usage"),
+            cpu_stats.get("system_cpu_usage"),
+            memory_stats.get("usage"),
+            memory_stats.get("limit"),
+        )
+        if key == self._last_key and self._last is not None:
+            return self._last
+        self._last_key = key
+
         cpu = compute_cpu_percent(stats)
-        if self._alpha and self._alpha > 0:
-            self._last_cpu = cpu if self._last_cpu is None else (self._alpha * cpu) + ((1 - self._alpha) * self._last_cpu)
-            cpu_out = float(self._last_cpu)
-        else:
-            cpu_out = float(cpu)
+        alpha = self._alpha
+        if alpha and alpha > 0:
+            last_cpu = self._last_cpu
+            if last_cpu is not None:
+                cpu = (alpha * cpu) + ((1 - alpha) * last_cpu)
+            self._last_cpu = cpu
+        cpu_out = float(cpu)
 
         used_bytes = compute_memory_used_bytes(stats, exclude_cache=self._exclude_cache)
         mem_mib = float(used_bytes / 1048576.0)
@@ -617,6 +694,26 @@ class ContainerStatsCoordinator(DataUpdateCoordinator[ContainerStatsData]):
         return data
 
 
+async def async_refresh_stats_coordinators(
+    api: PortainerAPI, coordinators: Iterable[ContainerStatsCoordinator]
+) -> None:
+    """Refresh many stats coordinators with one concurrent fan-out per endpoint."""
+    by_endpoint: Dict[int | str, Dict[str, ContainerStatsCoordinator]] = {}
+    for coord in coordinators:
+        # Sensors share coordinators (CPU/Mem/Mem%); fetch each container once
+        by_endpoint.setdefault(coord._endpoint_id, {})[coord._container_id] = coord  # noqa: SLF001
+
+    bulk = await asyncio.gather(
+        *(
+            api.get_stats_bulk(endpoint_id=eid, container_ids=list(coords))
+            for eid, coords in by_endpoint.items()
+        )
+    )
+    for coords, stats_by_id in zip(by_endpoint.values(), bulk):
+        for cid, coord in coords.items():
+            coord.async_set_updated_data(coord._build_stats_data(stats_by_id.get(cid)))  # noqa: SLF001
+
+
 def get_or_create_container_stats_coordinator(
     hass: HomeAssistant,
     *,
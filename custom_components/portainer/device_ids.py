@@ -2,51 +2,69 @@
 """Helpers to build stable DeviceInfo/identifiers for Portainer devices."""
 from __future__ import annotations
 
-from typing import Set, Tuple
+from functools import lru_cache
+from typing import FrozenSet, Tuple
 
 from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN
 
 
+# Identifier helpers are pure and called per entity/device_info build; memoize them.
+# Return values are shared between callers, hence frozensets.
+_IDENT_CACHE_SIZE = 4096
+
+
+# ASCII chars other than [a-z0-9_-] -> "_" (input is lowercased first)
+_ASCII_SLUG_TABLE = str.maketrans(
+    {chr(cp): "_" for cp in range(128) if not (chr(cp).isalnum() or chr(cp) in "_-")}
+)
+
+
+@lru_cache(maxsize=_IDENT_CACHE_SIZE)
 def slug(val: str) -> str:
     """Safe slug (lowercase, spaces->_, non-alnum -> _)."""
     s = str(val).strip().lower().replace(" ", "_")
+    if s.isascii():
+        return s.translate(_ASCII_SLUG_TABLE)
+    # Unicode letters/digits are kept; existing identifiers depend on that
     return "".join(ch if (ch.isalnum() or ch in ("_", "-")) else "_" for ch in s)
 
 
+@lru_cache(maxsize=_IDENT_CACHE_SIZE)
 def endpoint_identifier(endpoint_id: int | str) -> Tuple[str, str]:
     """Endpoint device identifier tuple."""
     return (DOMAIN, f"endpoint_{endpoint_id}")
 
 
+@lru_cache(maxsize=_IDENT_CACHE_SIZE)
 def stack_identifiers(
     endpoint_id: int | str, stack_id: int | str, stack_name: str
-) -> Set[Tuple[str, str]]:
+) -> FrozenSet[Tuple[str, str]]:
     """Canonical by name + legacy by id + legacy by name."""
     sslug = slug(stack_name)
-    return {
+    return frozenset({
         (DOMAIN, f"stack_{endpoint_id}_{sslug}"),           # canonical (by name)
         (DOMAIN, f"stack_{endpoint_id}_{stack_id}"),        # legacy (by numeric/synth id)
         (DOMAIN, f"stack_name_{endpoint_id}_{sslug}"),      # legacy alias (old via_device)
-    }
+    })
 
 
+@lru_cache(maxsize=_IDENT_CACHE_SIZE)
 def container_identifiers(
     endpoint_id: int | str,
     container_name: str,
     compose_stack: str | None = "",
     compose_service: str | None = "",
-) -> Set[Tuple[str, str]]:
+) -> FrozenSet[Tuple[str, str]]:
     """Return multiple identifiers to avoid device splits across restarts."""
-    ids: Set[Tuple[str, str]] = {
-        (DOMAIN, f"container_{endpoint_id}_{slug(container_name)}")
-    }
+    by_name = (DOMAIN, f"container_{endpoint_id}_{slug(container_name)}")
     if compose_stack and compose_service:
-        ids.add(
-            (DOMAIN, f"container_{endpoint_id}_{slug(compose_stack)}_{slug(compose_service)}")
-        )
-    return ids
+        return frozenset({
+            by_name,
+            (DOMAIN, f"container_{endpoint_id}_{slug(compose_stack)}_{slug(compose_service)}"),
+        })
+    return frozenset({by_name})
 
 
 def container_identifier(  # kept for backward compatibility if referenced elsewhere
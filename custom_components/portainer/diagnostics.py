@@ -10,6 +10,11 @@ from homeassistant.core import HomeAssistant
 from .const import DOMAIN, TO_REDACT
 
 
+def _coerce_float(value: Any, default: float = 0.0) -> float:
+    """Numbers as float; anything else (None, missing, junk) as `default`."""
+    return float(value) if isinstance(value, (int, float)) else default
+
+
 def _stats_snapshot(coord: Any) -> Dict[str, Any]:
     """Compact snapshot of one stats coordinator (CPU/Mem + trimmed raw)."""
     data = getattr(coord, "data", None)
@@ -30,17 +35,11 @@ def _stats_snapshot(coord: Any) -> Dict[str, Any]:
         "memory_stats": raw.get("memory_stats", {}),
     }
     try:
-        cpu = float(getattr(data, "cpu_percent", 0.0))
-    except Exception:
-        cpu = 0.0
-    try:
-        mem_mib = float(getattr(data, "mem_used_mib", 0.0))
-    except Exception:
-        mem_mib = 0.0
-    try:
-        mem_pct = float(getattr(data, "mem_percent", 0.0))
-    except Exception:
-        mem_pct = 0.0
+        cpu = _coerce_float(data.cpu_percent)
+        mem_mib = _coerce_float(data.mem_used_mib)
+        mem_pct = _coerce_float(data.mem_percent)
+    except AttributeError:  # not a stats sample
+        cpu = mem_mib = mem_pct = 0.0
 
     return {
         "last_update_success": getattr(coord, "last_update_success", None),
@@ -51,9 +50,13 @@ def _stats_snapshot(coord: Any) -> Dict[str, Any]:
     }
 
 
-def _get_main_data_block(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+def _entry_namespace(hass: HomeAssistant, entry: ConfigEntry) -> Any:
+    """Return hass.data[DOMAIN][entry_id] (dict, or a coordinator in old layouts), or None."""
+    return hass.data.get(DOMAIN, {}).get(entry.entry_id)
+
+
+def _get_main_data_block(ns: Any) -> dict[str, Any]:
     """Return the main data block while handling both dict/obj namespaces."""
-    ns = (hass.data.get(DOMAIN, {}) or {}).get(entry.entry_id)
     if ns is None:
         return {}
     # Historical variant: ns was a coordinator object with `.data`
@@ -69,9 +72,8 @@ def _get_main_data_block(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, A
     return {}
 
 
-def _collect_stats_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+def _collect_stats_diagnostics(ns: Any) -> Dict[str, Any]:
     """Build a small stats section from cached per-container stats coordinators."""
-    ns = (hass.data.get(DOMAIN, {}) or {}).get(entry.entry_id, {})
     stats_ns: Dict[str, Any] = {}
     if isinstance(ns, dict):
         stats_ns = ns.get("stats_coordinators", {}) or {}
@@ -85,10 +87,8 @@ def _collect_stats_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[
     # Try to include a bit of context from the main coordinator if available
     coord = ns.get("coordinator") if isinstance(ns, dict) else None
     if coord and getattr(coord, "raw_data", None):
-        endpoints = list((coord.raw_data.get("endpoints") or {}).keys())
-        by_name = coord.raw_data.get("containers_by_name") or {}
-        out["endpoints_loaded"] = endpoints
-        out["containers_indexed"] = sorted(list(by_name.keys()))
+        out["endpoints_loaded"] = list(coord.raw_data.get("endpoints", {}))
+        out["containers_indexed"] = sorted(coord.raw_data.get("containers_by_name", {}))
 
     # One compact block per container_key (endpoint:name)
     for container_key, c in stats_ns.items():
@@ -101,16 +101,18 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    options = config_entry.options
     entry_block = {
         "data": async_redact_data(config_entry.data, TO_REDACT),
-        "options": async_redact_data(config_entry.options, TO_REDACT),
+        "options": async_redact_data(options, TO_REDACT) if options else {},
     }
 
-    data_block = async_redact_data(
-        _get_main_data_block(hass, config_entry), TO_REDACT
-    )
+    ns = _entry_namespace(hass, config_entry)
+    raw = _get_main_data_block(ns)
+    # Not loaded yet is common; nothing to walk
+    data_block = async_redact_data(raw, TO_REDACT) if raw else {}
 
-    stats_block = _collect_stats_diagnostics(hass, config_entry)
+    stats_block = _collect_stats_diagnostics(ns)
 
     return {
         "entry": entry_block,
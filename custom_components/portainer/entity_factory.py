@@ -4,11 +4,16 @@ This class centralizes all logic for instantiating, validating, and filtering en
 making the process explicit, maintainable, and easy to extend for new entity types.
 """
 
-from logging import getLogger
+from logging import DEBUG, getLogger
 
 _LOGGER = getLogger(__name__)
 
 
+def _blank(value):
+    """True for None/empty values and whitespace-only strings."""
+    return not value or (isinstance(value, str) and not value.strip())
+
+
 class EntityFactory:
     def __init__(self, coordinator, dispatcher):
         self.coordinator = coordinator
@@ -17,19 +22,25 @@ class EntityFactory:
     def create_sensors(self, descriptions):
         """Create Portainer sensor entities."""
         new_entities = []
+        seen_uids: set = set()  # unique_ids already queued in new_entities
+        by_path: dict = {}
         for description in descriptions:
-            # Ensure data path exists
-            if description.data_path not in self.coordinator.data:
-                self.coordinator.data[description.data_path] = {}
-            data = self.coordinator.data[description.data_path]
-
-            # Without reference -> single entity
-            if not description.data_reference:
-                self._process_description_without_reference(new_entities, description, data)
-                continue
+            by_path.setdefault(description.data_path, []).append(description)
 
-            # With reference -> many entities; iterate over a snapshot (containers can disappear)
-            self._process_description_with_reference(new_entities, description, data)
+        for data_path, group in by_path.items():
+            # Ensure data path exists
+            data = self.coordinator.data.setdefault(data_path, {})
+            uids = None
+            for description in group:
+                # Without reference -> single entity
+                if not description.data_reference:
+                    self._process_description_without_reference(new_entities, seen_uids, description, data)
+                    continue
+
+                # With reference -> many entities; one snapshot per data_path (containers can disappear)
+                if uids is None:
+                    uids = tuple(data)
+                self._process_description_with_reference(new_entities, seen_uids, description, uids)
 
         final_entities = [entity for entity in new_entities if self._final_entity_validation(entity)]
         _LOGGER.debug("Returning %d validated entities", len(final_entities))
@@ -44,13 +55,15 @@ class EntityFactory:
             return False
         return True
 
-    def _create_temp_entity(self, func, description, uid=None):
-        """Call dispatcher safely; return None on errors or if factory declines (returns None)."""
+    def _get_factory(self, func):
+        factory = self.dispatcher.get(func)
+        if factory is None:
+            _LOGGER.debug("No factory registered for %s; skipping", func)
+        return factory
+
+    def _create_temp_entity(self, factory, description, uid=None):
+        """Call factory safely; return None on errors or if factory declines (returns None)."""
         try:
-            factory = self.dispatcher.get(func)
-            if factory is None:
-                _LOGGER.debug("No factory registered for %s; skipping", func)
-                return None
             if uid is not None:
                 return factory(self.coordinator, description, uid)
             return factory(self.coordinator, description)
@@ -75,7 +88,7 @@ class EntityFactory:
             return None, None
 
     def _is_valid_entity(self, unique_id, entity_name, description, uid=None):
-        if not unique_id or str(unique_id).strip() == "":
+        if _blank(unique_id):
             if uid is not None:
                 _LOGGER.warning(
                     "Skipping entity creation for %s (uid: %s): unique_id is None or empty (%r)",
@@ -87,7 +100,7 @@ class EntityFactory:
                     description.key, unique_id
                 )
             return False
-        if not entity_name or str(entity_name).strip() == "":
+        if _blank(entity_name):
             if uid is not None:
                 _LOGGER.warning(
                     "Skipping entity creation for %s (uid: %s): name is None or empty (%r)",
@@ -106,57 +119,68 @@ class EntityFactory:
             unique_id = entity.unique_id
             entity_name = entity.name
             entity_id = getattr(entity, "entity_id", None)
-            if not unique_id or str(unique_id).strip() == "":
+            if _blank(unique_id):
                 _LOGGER.error(
                     "Filtering out entity with invalid unique_id: %r (name: %r, entity_id: %r)",
                     unique_id, entity_name, entity_id
                 )
                 return False
-            if not entity_name or str(entity_name).strip() == "":
+            if _blank(entity_name):
                 _LOGGER.error(
                     "Filtering out entity with invalid name: %r (unique_id: %r, entity_id: %r)",
                     entity_name, unique_id, entity_id
                 )
                 return False
-            _LOGGER.debug("Final entity validation passed: unique_id=%s, name=%s, entity_id=%s",
-                          unique_id, entity_name, entity_id)
+            if _LOGGER.isEnabledFor(DEBUG):
+                _LOGGER.debug("Final entity validation passed: unique_id=%s, name=%s, entity_id=%s",
+                              unique_id, entity_name, entity_id)
             return True
         except (AttributeError, TypeError, KeyError) as e:
             _LOGGER.error("Error validating entity during final check: %s", e)
             return False
 
-    def _add_entity_if_valid(self, new_entities, temp_obj, description, uid=None):
+    def _add_entity_if_valid(self, new_entities, seen_uids, temp_obj, description, uid=None):
         """Add entity if present and valid."""
         if temp_obj is None:
             # Normal when a container disappears between list+build; keep quiet
-            _LOGGER.debug(
-                "Factory returned None for %s%s; skipping",
-                description.key,
-                f" (uid: {uid})" if uid is not None else "",
-            )
+            if _LOGGER.isEnabledFor(DEBUG):
+                _LOGGER.debug(
+                    "Factory returned None for %s%s; skipping",
+                    description.key,
+                    f" (uid: {uid})" if uid is not None else "",
+                )
             return
         unique_id, entity_name = self._validate_entity(temp_obj, description, uid)
         if not self._is_valid_entity(unique_id, entity_name, description, uid):
             return
-        if any(e.unique_id == unique_id for e in new_entities):
+        if unique_id in seen_uids:
             _LOGGER.debug("Entity with unique_id %s already queued; skipping", unique_id)
             return
-        _LOGGER.debug(
-            "Queued entity: unique_id=%s, name=%s, uid=%s, type=%s",
-            unique_id, entity_name, uid, type(temp_obj).__name__,
-        )
+        seen_uids.add(unique_id)
+        if _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug(
+                "Queued entity: unique_id=%s, name=%s, uid=%s, type=%s",
+                unique_id, entity_name, uid, type(temp_obj).__name__,
+            )
         new_entities.append(temp_obj)
 
     # ------------ description processors ------------
 
-    def _process_description_without_reference(self, new_entities, description, data):
+    def _process_description_without_reference(self, new_entities, seen_uids, description, data):
         if not self._should_create_entity(description, data):
             return
-        temp_obj = self._create_temp_entity(description.func, description)
-        self._add_entity_if_valid(new_entities, temp_obj, description)
-
-    def _process_description_with_reference(self, new_entities, description, data):
-        # Iterate over a snapshot; the underlying dict may change during stack operations
-        for uid in list(data):
-            temp_obj = self._create_temp_entity(description.func, description, uid)
-            self._add_entity_if_valid(new_entities, temp_obj, description, uid)
+        factory = self._get_factory(description.func)
+        if factory is None:
+            return
+        temp_obj = self._create_temp_entity(factory, description)
+        self._add_entity_if_valid(new_entities, seen_uids, temp_obj, description)
+
+    def _process_description_with_reference(self, new_entities, seen_uids, description, uids):
+        # Resolve once per description, not per uid
+        factory = self._get_factory(description.func)
+        if factory is None:
+            return
+        # uids is a snapshot taken by create_sensors; the dict may change during stack operations
+        for uid in uids:
+            temp_obj = self._create_temp_entity(factory, description, uid)
+            self._add_entity_if_valid(new_entities, seen_uids, temp_obj, description, uid)
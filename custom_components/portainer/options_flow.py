@@ -30,6 +30,29 @@ NAME_MODE_OPTIONS = {
     NAME_MODE_CONTAINER: "Container name",
     NAME_MODE_STACK_SERVICE: "Stack/Service",
 }
+_NAME_MODE_KEYS = tuple(NAME_MODE_OPTIONS)
+_NAME_MODE_VALIDATOR = vol.In(_NAME_MODE_KEYS)
+
+# (option key, default, validator) in form order; validators are built once at import
+_OPTIONS_SCHEMA_FIELDS = (
+    (CONF_FEATURE_HEALTH_CHECK, True, bool),
+    (CONF_FEATURE_RESTART_POLICY, True, bool),
+    (CONF_FEATURE_UPDATE_CHECK, True, bool),
+    (CONF_UPDATE_CHECK_TIME, "04:30", str),
+    (CONF_CONTAINER_SENSOR_NAME_MODE, DEFAULT_CONTAINER_SENSOR_NAME_MODE, _NAME_MODE_VALIDATOR),
+    # stats
+    (
+        CONF_STATS_SCAN_INTERVAL,
+        DEFAULT_STATS_SCAN_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+    ),
+    (
+        CONF_STATS_SMOOTHING_ALPHA,
+        DEFAULT_STATS_SMOOTHING_ALPHA,
+        vol.All(vol.Coerce(float), vol.Range(min=0.0, max=1.0)),
+    ),
+    (CONF_MEM_EXCLUDE_CACHE, DEFAULT_MEM_EXCLUDE_CACHE, bool),
+)
 
 
 class PortainerOptionsFlowHandler(config_entries.OptionsFlow):
@@ -42,60 +65,11 @@ class PortainerOptionsFlowHandler(config_entries.OptionsFlow):
             data = {**self.config_entry.options, **user_input}
             return self.async_create_entry(title="", data=data)
 
-        opts = {**self.config_entry.options}
-        defaults = {
-            
-            CONF_FEATURE_HEALTH_CHECK: opts.get(CONF_FEATURE_HEALTH_CHECK, True),
-            CONF_FEATURE_RESTART_POLICY: opts.get(CONF_FEATURE_RESTART_POLICY, True),
-            CONF_FEATURE_UPDATE_CHECK: opts.get(CONF_FEATURE_UPDATE_CHECK, True),
-            CONF_UPDATE_CHECK_TIME: opts.get(CONF_UPDATE_CHECK_TIME, "04:30"),
-            CONF_CONTAINER_SENSOR_NAME_MODE: opts.get(
-                CONF_CONTAINER_SENSOR_NAME_MODE, DEFAULT_CONTAINER_SENSOR_NAME_MODE
-            ),
-            # stats
-            CONF_STATS_SCAN_INTERVAL: opts.get(
-                CONF_STATS_SCAN_INTERVAL, DEFAULT_STATS_SCAN_INTERVAL
-            ),
-            CONF_STATS_SMOOTHING_ALPHA: opts.get(
-                CONF_STATS_SMOOTHING_ALPHA, DEFAULT_STATS_SMOOTHING_ALPHA
-            ),
-            CONF_MEM_EXCLUDE_CACHE: opts.get(
-                CONF_MEM_EXCLUDE_CACHE, DEFAULT_MEM_EXCLUDE_CACHE
-            ),
-        }
-
+        opts = self.config_entry.options  # read-only here; no copy needed
         schema = vol.Schema(
             {
-                
-                vol.Optional(
-                    CONF_FEATURE_HEALTH_CHECK, default=defaults[CONF_FEATURE_HEALTH_CHECK]
-                ): bool,
-                vol.Optional(
-                    CONF_FEATURE_RESTART_POLICY, default=defaults[CONF_FEATURE_RESTART_POLICY]
-                ): bool,
-                vol.Optional(
-                    CONF_FEATURE_UPDATE_CHECK, default=defaults[CONF_FEATURE_UPDATE_CHECK]
-                ): bool,
-                vol.Optional(
-                    CONF_UPDATE_CHECK_TIME, default=defaults[CONF_UPDATE_CHECK_TIME]
-                ): str,
-                vol.Optional(
-                    CONF_CONTAINER_SENSOR_NAME_MODE,
-                    default=defaults[CONF_CONTAINER_SENSOR_NAME_MODE],
-                ): vol.In(list(NAME_MODE_OPTIONS.keys())),
-                
-                vol.Optional(
-                    CONF_STATS_SCAN_INTERVAL,
-                    default=defaults[CONF_STATS_SCAN_INTERVAL],
-                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
-                vol.Optional(
-                    CONF_STATS_SMOOTHING_ALPHA,
-                    default=defaults[CONF_STATS_SMOOTHING_ALPHA],
-                ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=1.0)),
-                vol.Optional(
-                    CONF_MEM_EXCLUDE_CACHE,
-                    default=defaults[CONF_MEM_EXCLUDE_CACHE],
-                ): bool,
+                vol.Optional(key, default=opts.get(key, default)): validator
+                for key, default, validator in _OPTIONS_SCHEMA_FIELDS
             }
         )
 
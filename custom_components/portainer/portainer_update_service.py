@@ -19,6 +19,15 @@ class PortainerUpdateService:
     """Service to handle Portainer update checks and registry interactions."""
 
     REGISTRY_LITERAL = "{registry}"
+    DEFAULT_DESCRIPTIONS = {
+        0: "No update available.",
+        1: "Update available!",
+        2: "Update status not yet checked.",
+        401: "Unauthorized (registry credentials required or invalid) for registry {registry}.",
+        404: "Image not found on registry ({registry}).",
+        429: "Registry rate limit reached.",
+        500: "Registry/internal error.",
+    }
 
     def __init__(self, hass, config_entry, api, features, config_entry_id):
         self.hass = hass
@@ -30,6 +39,7 @@ class PortainerUpdateService:
         self.cached_registry_responses = {}
         self.last_update_check: datetime | None = None
         self.force_update_requested: bool = False  # Flag for force update
+        self._status_texts: dict | None = None  # translated update-status texts
 
     @property
     def update_check_time(self):
@@ -49,8 +59,7 @@ class PortainerUpdateService:
 
         if not image_name:
             self._log_and_cache_no_image(container_id, container_name)
-            translations = getattr(self.hass, "translations", {})
-            status_description = self._get_update_description(500, None, translations)
+            status_description = self._get_update_description(500)
             _LOGGER.error(
                 "Container %s: No image name found, skipping update check (error)",
                 container_name,
@@ -101,10 +110,7 @@ class PortainerUpdateService:
             )
             if update_available:
                 result["status"] = 1
-                translations = getattr(self.hass, "translations", {})
-                result["status_description"] = self._get_update_description(
-                    1, None, translations
-                )
+                result["status_description"] = self._get_update_description(1)
                 self.cached_update_results[container_id] = result
             else:
                 result["status"] = 0
@@ -118,8 +124,7 @@ class PortainerUpdateService:
                     "Container %s: No cache entry for update check (new container or not yet checked)",
                     container_name,
                 )
-                translations = getattr(self.hass, "translations", {})
-                status_description = self._get_update_description(2, None, translations)
+                status_description = self._get_update_description(2)
                 return {
                     "status": 2,
                     "status_description": status_description,
@@ -199,7 +204,6 @@ class PortainerUpdateService:
         image_key: str,
     ) -> dict:
         """Fetch the registry response for a given image."""
-        translations = getattr(self.hass, "translations", {})
         arch, os = self._get_arch_and_os(eid, image_key)
         try:
             from .docker_registry import BaseRegistry
@@ -210,15 +214,13 @@ class PortainerUpdateService:
             self.cached_registry_responses[image_key] = manifest
             return {
                 "status": 200,
-                "status_description": self._get_update_description(
-                    0, None, translations
-                ),
+                "status_description": self._get_update_description(0),
                 "manifest": manifest,
                 "registry_used": True,
             }
         except Exception as e:
             return self._handle_registry_exception(
-                e, registry, image_key, self._get_update_description, translations
+                e, registry, image_key, self._get_update_description
             )
 
     def _handle_registry_exception(
@@ -421,40 +423,35 @@ class PortainerUpdateService:
 
     def _get_update_description(self, status, registry_name=None, translations=None):
         """Get a human-readable description for the update status."""
-        desc_key = f"update_status_{status}"
         if translations is None:
-            translations = getattr(self.hass, "translations", {})
-        if (
-            translations
-            and TRANSLATION_UPDATE_CHECK_STATUS_STATE in translations
-            and desc_key in translations[TRANSLATION_UPDATE_CHECK_STATUS_STATE]
-        ):
-            text = translations[TRANSLATION_UPDATE_CHECK_STATUS_STATE][desc_key]
-            if self.REGISTRY_LITERAL in text and registry_name:
-                return text.replace(self.REGISTRY_LITERAL, registry_name)
-            return text
-        default_map = {
-            0: "No update available.",
-            1: "Update available!",
-            2: "Update status not yet checked.",
-            401: "Unauthorized (registry credentials required or invalid) for registry {registry}.",
-            404: "Image not found on registry ({registry}).",
-            429: "Registry rate limit reached.",
-            500: "Registry/internal error.",
-        }
-        text = default_map.get(status, f"Status code: {status}")
+            texts = self._status_translations()
+        else:
+            texts = translations.get(TRANSLATION_UPDATE_CHECK_STATUS_STATE) or {}
+        text = texts.get(f"update_status_{status}")
+        if text is None:
+            text = self.DEFAULT_DESCRIPTIONS.get(status, f"Status code: {status}")
         if self.REGISTRY_LITERAL in text and registry_name:
             return text.replace(self.REGISTRY_LITERAL, registry_name)
         return text
 
+    def _status_translations(self) -> dict:
+        """Return the update-status translations, looked up once hass has them loaded."""
+        if self._status_texts is None:
+            texts = getattr(self.hass, "translations", {}).get(
+                TRANSLATION_UPDATE_CHECK_STATUS_STATE
+            )
+            if not texts:
+                return {}
+            self._status_texts = texts
+        return self._status_texts
+
     def _log_and_cache_no_image(self, container_id: str, container_name: str) -> None:
         """Log and cache the case where no image name is found."""
         _LOGGER.debug(
             "Container %s: No image name found, skipping update check",
             container_name,
         )
-        translations = getattr(self.hass, "translations", {})
-        status_description = self._get_update_description(500, None, translations)
+        status_description = self._get_update_description(500)
         self.cached_update_results[container_id] = {
             "status": 500,
             "status_description": status_description,
@@ -50,6 +50,7 @@ from .const import (
 from .coordinator import (
     PortainerCoordinator,
     ContainerStatsCoordinator,
+    async_refresh_stats_coordinators,
     get_or_create_container_stats_coordinator,
 )
 from .device_ids import container_device_info, stack_device_info
@@ -111,10 +112,15 @@ async def async_setup_entry(
     base_entities = [e for e in unique_entities if not isinstance(e, PortainerContainerStatsSensor)]
     stats_entities = [e for e in unique_entities if isinstance(e, PortainerContainerStatsSensor)]
 
+    # Stack sensors (with compose-label fallback)
+    stack_sensors = _create_stack_sensors(coordinator)
+    _LOGGER.info("Initial sensor setup: Added %d stack container sensors", len(stack_sensors))
+
     # Ensure parent devices exist BEFORE adding any entities (fixes via_device warnings)
     _ensure_parent_devices(hass, config_entry, coordinator)
 
-    # Add base entities
+    # Base + stack sensors share update_before_add=True, so register them in one batch
+    base_entities += stack_sensors
     for e in base_entities:
         uid = getattr(e, "unique_id", None)
         if uid:
@@ -130,23 +136,14 @@ async def async_setup_entry(
     if stats_entities:
         async_add_entities_callback(stats_entities, update_before_add=False)
         try:
-            await asyncio.gather(*(e.coordinator.async_request_refresh() for e in stats_entities))
+            await async_refresh_stats_coordinators(
+                coordinator.api, (e.coordinator for e in stats_entities)
+            )
         except Exception:  # pragma: no cover
             _LOGGER.debug("Could not schedule initial stats refresh for some stats sensors")
 
-    # Stack sensors (with compose-label fallback)
-    stack_sensors = _create_stack_sensors(coordinator)
-    _LOGGER.info("Initial sensor setup: Added %d stack container sensors", len(stack_sensors))
-    _ensure_parent_devices(hass, config_entry, coordinator)
-    for e in stack_sensors:
-        uid = getattr(e, "unique_id", None)
-        if uid:
-            created_uids.add(uid)
-    if stack_sensors:
-        async_add_entities_callback(stack_sensors, update_before_add=True)
-
     @callback
-    async def async_update_controller(_coordinator):
+    async def async_update_controller(_coordinator, *_payload):
         await _handle_update_controller(
             hass,
             config_entry,
@@ -261,7 +258,9 @@ async def _handle_update_controller(
         if stats_new:
             async_add_entities_callback(stats_new, update_before_add=False)
             try:
-                await asyncio.gather(*(e.coordinator.async_request_refresh() for e in stats_new))
+                await async_refresh_stats_coordinators(
+                    coordinator.api, (e.coordinator for e in stats_new)
+                )
             except Exception:  # pragma: no cover
                 _LOGGER.debug("Could not schedule initial stats refresh for some stats sensors")
 
@@ -284,19 +283,12 @@ def _collect_existing_uids(
     platform_entities = platform._entities if hasattr(platform, "_entities") else []
     platform_uids: Set[str] = {e.unique_id for e in platform_entities if getattr(e, "unique_id", None)}
 
-    registry = er.async_get(hass)
-    registry_uids: Set[str] = set()
-    for entry in list(registry.entities.values()):
-        try:
-            if (
-                entry.platform == DOMAIN
-                and entry.config_entry_id == config_entry.entry_id
-                and entry.domain == "sensor"
-                and entry.unique_id
-            ):
-                registry_uids.add(entry.unique_id)
-        except Exception:
-            continue
+    # Indexed by config entry in the registry, so this doesn't walk every entity in HA
+    registry_uids: Set[str] = {
+        entry.unique_id
+        for entry in er.async_entries_for_config_entry(er.async_get(hass), config_entry.entry_id)
+        if entry.platform == DOMAIN and entry.domain == "sensor" and entry.unique_id
+    }
 
     created_uids: Set[str] = set(hass.data[DOMAIN][config_entry.entry_id].get(_CREATED_UIDS_KEY, set()))
     alias_uids: Set[str] = set(hass.data.get(DOMAIN, {}).get(_UID_ALIASES_KEY, set()))
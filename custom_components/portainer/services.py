@@ -52,8 +52,8 @@ async def async_register_services(hass: HomeAssistant, coordinator):
         )
     
         try:
-            ok = await hass.async_add_executor_job(
-                getattr(CONTROL, f"{action}_container"), endpoint_id, container_id
+            ok = await getattr(CONTROL, f"async_{action}_container")(
+                endpoint_id, container_id
             )
             if ok:
                 _LOGGER.info(
@@ -196,7 +196,7 @@ class PortainerContainerSwitch(CoordinatorEntity, SwitchEntity):
         if not current:
             _LOGGER.warning("Container '%s' not found on endpoint %s", self._container_name, self._endpoint_id)
             return
-        await self.hass.async_add_executor_job(self._control.start_container, self._endpoint_id, current["Id"])
+        await self._control.async_start_container(self._endpoint_id, current["Id"])
         await self.coordinator.async_request_refresh()
         _schedule_refresh_burst(self.hass, self.coordinator, delays=(1.0, 3.0, 7.0))  # WHY: avoid stale "running"
 
@@ -205,7 +205,7 @@ class PortainerContainerSwitch(CoordinatorEntity, SwitchEntity):
         if not current:
             _LOGGER.warning("Container '%s' not found on endpoint %s", self._container_name, self._endpoint_id)
             return
-        await self.hass.async_add_executor_job(self._control.stop_container, self._endpoint_id, current["Id"])
+        await self._control.async_stop_container(self._endpoint_id, current["Id"])
         await self.coordinator.async_request_refresh()
         _schedule_refresh_burst(self.hass, self.coordinator, delays=(1.0, 3.0, 7.0))
 
@@ -262,25 +262,19 @@ class PortainerStackSwitch(CoordinatorEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool:
-        containers_by_name = self.coordinator.raw_data.get("containers_by_name", {})
-        if not containers_by_name:
-            return False
-        for c in containers_by_name.values():
-            if c.get("EndpointId") == self._endpoint_id and c.get("Compose_Stack") == self._name:
-                return True
-        return False
+        return (self._endpoint_id, self._name) in self.coordinator.raw_data["compose_stacks"]
 
     @property
     def device_info(self):
         return stack_device_info(self._endpoint_id, self._stack_id, self._name)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(self._control.start_stack, self._endpoint_id, self._stack_id)
+        await self._control.async_start_stack(self._endpoint_id, self._stack_id)
         await self.coordinator.async_request_refresh()
         _schedule_refresh_burst(self.hass, self.coordinator, delays=(1.0, 3.0, 7.0))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(self._control.stop_stack, self._endpoint_id, self._stack_id)
+        await self._control.async_stop_stack(self._endpoint_id, self._stack_id)
         await self.coordinator.async_request_refresh()
         _schedule_refresh_burst(self.hass, self.coordinator, delays=(1.0, 3.0, 7.0))
 
@@ -1,12 +1,14 @@
+import json
 import types
 from custom_components.portainer.api import PortainerAPI
 
 class DummyResponse:
-    def __init__(self, status=200, payload=None, text=""):
+    def __init__(self, status=200, payload=None, text="", headers=None):
         self.status_code = status
         self._payload = payload
         self.text = text or ""
-        self.content = (b"{}" if payload is not None else b"")
+        self.content = (json.dumps(payload).encode() if payload is not None else b"")
+        self.headers = headers or {}
 
     def json(self):
         return self._payload
@@ -33,3 +35,192 @@ def test_query_non_200_sets_error(monkeypatch):
     data = api.query("stacks", method="get", params={})
     assert data is None
     assert api.connected() is False
+
+
+def test_query_caches_stacks_until_invalidated(monkeypatch):
+    api = _mk_api()
+    calls = []
+    def fake_get(url, headers=None, params=None, verify=None, timeout=None):
+        calls.append(url)
+        return DummyResponse(status=200, payload=[{"Id": 1}])
+    monkeypatch.setattr("custom_components.portainer.api.requests_get", fake_get)
+    assert api.query("stacks") == [{"Id": 1}]
+    assert api.query("stacks") == [{"Id": 1}]
+    assert len(calls) == 1
+    api.invalidate_cache("stacks")
+    api.query("stacks")
+    assert len(calls) == 2
+    api._record_failure("endpoints", "timeout")
+    api.query("stacks")
+    assert len(calls) == 3
+
+
+def test_inspect_404_keeps_cached_stacks(monkeypatch):
+    api = _mk_api()
+    calls = []
+    def fake_get(url, headers=None, params=None, verify=None, timeout=None):
+        calls.append(url)
+        if url.endswith("/json"):
+            return DummyResponse(status=404, text="No such container")
+        return DummyResponse(status=200, payload=[{"Id": 1}])
+    monkeypatch.setattr("custom_components.portainer.api.requests_get", fake_get)
+    assert api.query("stacks") == [{"Id": 1}]
+    assert api.query("endpoints/1/docker/containers/gone/json") is None
+    assert api.query("stacks") == [{"Id": 1}]
+    assert len(calls) == 2
+
+def test_query_does_not_cache_container_listing(monkeypatch):
+    api = _mk_api()
+    calls = []
+    def fake_get(url, headers=None, params=None, verify=None, timeout=None):
+        calls.append(url)
+        return DummyResponse(status=200, payload=[])
+    monkeypatch.setattr("custom_components.portainer.api.requests_get", fake_get)
+    api.query("endpoints/1/docker/containers/json", "get", {"all": True})
+    api.query("endpoints/1/docker/containers/json", "get", {"all": True})
+    assert len(calls) == 2
+
+
+def test_query_does_not_cache_endpoints(monkeypatch):
+    api = _mk_api()
+    responses = [DummyResponse(status=200, payload=[{"Id": 1}]), DummyResponse(status=500)]
+    def fake_get(url, headers=None, params=None, verify=None, timeout=None):
+        return responses.pop(0)
+    monkeypatch.setattr("custom_components.portainer.api.requests_get", fake_get)
+    assert api.query("endpoints") == [{"Id": 1}]
+    # An outage must reach the caller (and the failure counters), not a cached list
+    assert api.query("endpoints") is None
+
+
+def test_query_304_reuses_body_for_etag(monkeypatch):
+    api = _mk_api()
+    seen_headers = []
+    responses = [
+        DummyResponse(status=200, payload=[{"Id": 7}], headers={"ETag": '"v1"'}),
+        DummyResponse(status=304, payload=None),
+    ]
+    def fake_get(url, headers=None, params=None, verify=None, timeout=None):
+        seen_headers.append(dict(headers))
+        return responses.pop(0)
+    monkeypatch.setattr("custom_components.portainer.api.requests_get", fake_get)
+    service = "endpoints/1/docker/images/json"
+    assert api.query(service) == [{"Id": 7}]
+    assert api.query(service) == [{"Id": 7}]
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
+    assert api.connected() is True
+
+
+def test_query_skips_etags_for_container_inspects(monkeypatch):
+    api = _mk_api()
+    seen_headers = []
+    def fake_get(url, headers=None, params=None, verify=None, timeout=None):
+        seen_headers.append(dict(headers))
+        return DummyResponse(status=200, payload={"Id": "abc"}, headers={"ETag": '"v1"'})
+    monkeypatch.setattr("custom_components.portainer.api.requests_get", fake_get)
+    service = "endpoints/1/docker/containers/abc/json"
+    api.query(service, "get", {"all": True})
+    api.query(service, "get", {"all": True})
+    # Container ids churn; nothing may be retained per inspect path
+    assert "If-None-Match" not in seen_headers[1]
+    assert api._etags == {} and api._last_body == {}
+
+
+def test_connection_test_requests_single_endpoint(monkeypatch):
+    api = _mk_api()
+    seen = {}
+    def fake_get(url, headers=None, params=None, verify=None, timeout=None):
+        seen["url"], seen["params"], seen["headers"] = url, params, headers
+        return DummyResponse(status=200, payload=[{"Id": 1}])
+    monkeypatch.setattr("custom_components.portainer.api.requests_get", fake_get)
+    assert api.connection_test() == (True, "")
+    assert seen["url"].endswith("/api/endpoints")
+    assert seen["params"] == {"limit": 1}
+    assert seen["headers"]["X-API-Key"] == "abc"
+
+
+def test_retry_policy_never_resends_posts():
+    from custom_components.portainer.api import _build_retry
+
+    retry = _build_retry()
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+
+
+class DummyStatsResponse:
+    def __init__(self, status=200, payload=None, body=None):
+        self.status = status
+        self.reason = "OK" if status == 200 else "Error"
+        self._payload = payload
+        self._body = body
+
+    async def read(self):
+        if self._body is not None:
+            return self._body
+        return json.dumps(self._payload).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class DummyStatsSession:
+    connector = None
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        return self.response
+
+
+async def test_get_container_stats_async_200():
+    api = _mk_api()
+    payload = {"cpu_stats": {}}
+    session = DummyStatsSession(DummyStatsResponse(status=200, payload=payload))
+    api._client = session
+    data = await api.get_container_stats(endpoint_id=1, container_id="abc")
+    assert data == payload
+    assert session.calls == ["https://portainer:9443/api/endpoints/1/docker/containers/abc/stats"]
+
+
+async def test_http_semaphore_is_created_once():
+    api = _mk_api()
+    assert api._http_sem is None
+    api._client = DummyStatsSession(DummyStatsResponse(status=200, body=b""))
+    await api.get_container_stats(endpoint_id=1, container_id="a")
+    sem = api._http_sem
+    await api.get_container_stats(endpoint_id=1, container_id="b")
+    assert api._http_sem is sem
+    assert api.http_slots() is sem
+
+
+async def test_get_container_stats_async_non_200_keeps_connected_state():
+    api = _mk_api()
+    api._client = DummyStatsSession(DummyStatsResponse(status=404))
+    data = await api.get_container_stats(endpoint_id=1, container_id="gone")
+    assert data is None
+    assert api.connected() is False
+
+
+async def test_get_container_stats_empty_body_returns_empty_dict():
+    api = _mk_api()
+    api._client = DummyStatsSession(DummyStatsResponse(status=200, body=b""))
+    assert await api.get_container_stats(endpoint_id=1, container_id="idle") == {}
+
+
+async def test_get_stats_bulk_maps_failures_to_none():
+    api = _mk_api()
+
+    async def fake_stats(*, endpoint_id, container_id):
+        if container_id == "boom":
+            raise RuntimeError("boom")
+        return {"id": container_id}
+
+    api.get_container_stats = fake_stats
+    out = await api.get_stats_bulk(endpoint_id=1, container_ids=["a", "boom", "b"])
+    assert out == {"a": {"id": "a"}, "boom": None, "b": {"id": "b"}}
@@ -244,3 +244,24 @@ class TestEntityAvailabilityFix:
 
         # Should not be available since feature is disabled
         assert sensor.available is False
+
+    async def test_button_update_entry_refreshes_cached_flag(
+        self,
+        coordinator_base,
+        mock_config_entry_feature_disabled,
+        mock_config_entry_feature_enabled,
+    ):
+        """Test the cached feature flag follows an options update."""
+        coordinator_base.config_entry = mock_config_entry_feature_disabled
+
+        button = ForceUpdateCheckButton(
+            coordinator_base, mock_config_entry_feature_disabled.entry_id
+        )
+        button.async_write_ha_state = MagicMock()
+        assert button.available is False
+
+        await button.async_update_entry(mock_config_entry_feature_enabled)
+
+        assert button.available is True
+        assert button.entity_registry_enabled_default is True
+        button.async_write_ha_state.assert_called_once()
@@ -13,9 +13,11 @@ class DummyCoordinator:
         opts = {CONF_CONTAINER_SENSOR_NAME_MODE: NAME_MODE_CONTAINER}
         if options:
             opts.update(options)
-        self.raw_data = {"containers_by_name": containers_by_name}
+        self.raw_data = {"containers_by_name": containers_by_name, "containers_by_compose": {}}
         self.data = {"endpoints": {}, "containers": {}}
         self.config_entry = SimpleNamespace(options=opts, data={"name": "Portainer Test"}, entry_id="test-entry")
+        self.container_name_mode = opts[CONF_CONTAINER_SENSOR_NAME_MODE]
+        self.last_update_success = True
         # minimal hass stub
         self.hass = SimpleNamespace(
             async_add_executor_job=lambda func, *a, **k: func(*a, **k),
@@ -28,13 +30,15 @@ class DummyCoordinator:
     async def async_request_refresh(self):
         return None
 
+    async def async_request_post_action_refresh(self):
+        return None
+
 
 class DummyControl:
     def __init__(self):
         self.calls = []
 
-    # keep sync signature (prod code may call this in thread executor)
-    def restart_container(self, endpoint_id, container_id):
+    async def async_restart_container(self, endpoint_id, container_id):
         self.calls.append((endpoint_id, container_id))
         return True
 
@@ -60,20 +64,234 @@ async def test_restart_calls_control_with_current_id_after_rename(hass):
     btn = PortainerContainerRestartButton(coord, ctrl, c_old)
     btn.hass = hass
 
-    # replace the executor path with a direct call so the test works with both
-    # old (awaits control) and new (executor-based) implementations
-    async def fake_run_in_executor(func, *args):
-        return func(*args)
-
-    # monkeypatch instance method
-    btn._run_in_executor = fake_run_in_executor  # type: ignore[attr-defined]
-
     # simulate rename: new container id + possibly new name
     c_new = mkc(1, "newname", "MyApp", "web", cid="new-id")
     coord.raw_data["containers_by_name"] = {"1:newname": c_new}
+    coord.raw_data["containers_by_compose"] = {(1, "MyApp", "web"): c_new}
 
     # press should resolve current container and call control with new id
     await btn.async_press()
 
-    assert ctrl.calls, "restart_container was not called"
+    assert ctrl.calls, "async_restart_container was not called"
     assert ctrl.calls[-1] == (1, "new-id")
+
+
+def test_resolve_uses_compose_index_after_rename():
+    c_old = mkc(1, "web", "MyApp", "web", cid="old-id")
+    coord = DummyCoordinator({"1:web": c_old})
+    btn = PortainerContainerRestartButton(coord, DummyControl(), c_old)
+
+    c_new = mkc(1, "newname", "MyApp", "web", cid="new-id")
+    coord.raw_data["containers_by_name"] = {}
+    coord.raw_data["containers_by_compose"] = {(1, "MyApp", "web"): c_new}
+
+    assert btn._resolve_current_container() is c_new
+    assert btn._container_name == "newname"
+
+
+def test_label_cache_follows_name_mode_change():
+    from custom_components.portainer.const import NAME_MODE_STACK_SERVICE
+
+    c = mkc(1, "myapp-web-1", "MyApp", "web")
+    coord = DummyCoordinator({"1:myapp-web-1": c})
+    btn = PortainerContainerRestartButton(coord, DummyControl(), c)
+    assert btn._compute_label() == "myapp-web-1"
+
+    # coordinator refreshes its cached mode when options change
+    coord.container_name_mode = NAME_MODE_STACK_SERVICE
+    btn._refresh_name()
+    assert btn._attr_name == "Restart: MyApp/web"
+
+
+def test_device_info_follows_rename():
+    c_old = mkc(1, "web", "MyApp", "web", cid="old-id")
+    coord = DummyCoordinator({"1:web": c_old})
+    btn = PortainerContainerRestartButton(coord, DummyControl(), c_old)
+    assert btn.device_info["name"] == "Container: web"
+    assert btn.device_info is btn.device_info
+
+    c_new = mkc(1, "web2", "MyApp", "web", cid="new-id")
+    coord.raw_data["containers_by_name"] = {"1:web2": c_new}
+    coord.raw_data["containers_by_compose"] = {(1, "MyApp", "web"): c_new}
+    btn._resolve_current_container()
+    assert btn.device_info["name"] == "Container: web2"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("  My_App  ", "my-app"),
+        ("a--b__c  d", "a-b-c-d"),
+        ("__", "unnamed"),
+        (None, "unnamed"),
+        ("Café.v2", "caf-v2"),
+    ],
+)
+def test_slugify_stack_name(raw, expected):
+    from custom_components.portainer.button import _slugify_stack_name
+
+    assert _slugify_stack_name(raw) == expected
+
+
+def test_ensure_parent_devices_skips_unchanged(monkeypatch):
+    from custom_components.portainer import button as button_mod
+
+    calls = []
+    devreg = SimpleNamespace(async_get_or_create=lambda **kw: calls.append(kw))
+    monkeypatch.setattr(button_mod.dr, "async_get", lambda hass: devreg)
+
+    coord = DummyCoordinator({"1:web": mkc(1, "web", "MyApp", "web")})
+    coord.raw_data["endpoints"] = {1: {"Name": "local"}}
+    coord.raw_data["stacks"] = {"1:5": {"Id": 5, "Name": "MyApp", "EndpointId": 1}}
+    entry = coord.config_entry
+
+    sig = button_mod._ensure_parent_devices(None, entry, coord)
+    assert len(calls) == 2
+
+    assert button_mod._ensure_parent_devices(None, entry, coord, sig) == sig
+    assert len(calls) == 2
+
+    coord.raw_data["stacks"]["1:6"] = {"Id": 6, "Name": "Other", "EndpointId": 1}
+    button_mod._ensure_parent_devices(None, entry, coord, sig)
+    assert len(calls) == 5
+
+
+def test_ensure_parent_devices_derives_endpoints_without_endpoint_data(monkeypatch):
+    from custom_components.portainer import button as button_mod
+
+    names = []
+    devreg = SimpleNamespace(async_get_or_create=lambda **kw: names.append(kw["name"]))
+    monkeypatch.setattr(button_mod.dr, "async_get", lambda hass: devreg)
+
+    coord = DummyCoordinator({"1:web": mkc(1, "web"), "2:db": mkc(2, "db")})
+    coord.raw_data["endpoints"] = {}
+    coord.raw_data["stacks"] = {"3:5": {"Id": 5, "Name": "MyApp", "EndpointId": 3}}
+
+    button_mod._ensure_parent_devices(None, coord.config_entry, coord)
+    assert {n for n in names if n.startswith("Endpoint:")} == {
+        "Endpoint: 1",
+        "Endpoint: 2",
+        "Endpoint: 3",
+    }
+
+
+def test_resolution_is_memoized_per_refresh_tick():
+    c = mkc(1, "web", cid="a")
+    coord = DummyCoordinator({"1:web": c})
+    coord._tick_counter = 1
+    btn = PortainerContainerRestartButton(coord, DummyControl(), c)
+
+    # same tick: raw_data is not consulted again
+    coord.raw_data["containers_by_name"] = {}
+    assert btn._resolve_current_container() is c
+
+    coord._tick_counter = 2
+    assert btn._resolve_current_container() is None
+
+
+def test_available_is_pushed_by_coordinator_update():
+    from unittest.mock import MagicMock
+
+    c = mkc(1, "web", cid="a")
+    coord = DummyCoordinator({"1:web": c})
+    btn = PortainerContainerRestartButton(coord, DummyControl(), c)
+    btn.async_write_ha_state = MagicMock()
+    assert btn.available is True
+
+    coord.raw_data["containers_by_name"] = {}
+    assert btn.available is True  # unchanged until the coordinator pushes an update
+
+    btn._handle_coordinator_update()
+    assert btn.available is False
+    btn.async_write_ha_state.assert_called_once()
+
+
+def test_unavailable_while_refresh_fails():
+    c = mkc(1, "web", cid="a")
+    coord = DummyCoordinator({"1:web": c})
+    coord._tick_counter = 1
+    btn = PortainerContainerRestartButton(coord, DummyControl(), c)
+    btn.async_write_ha_state = lambda: None
+
+    # UpdateFailed: tick does not advance, so the memo still yields the container
+    coord.last_update_success = False
+    btn._handle_coordinator_update()
+    assert btn.available is False
+
+    coord.last_update_success = True
+    assert btn.available is True
+
+
+@pytest.mark.parametrize(
+    ("mode", "stack", "service", "expected"),
+    [
+        ("service", "MyApp", "web", "web"),
+        ("service", "", "", "myapp-web-1"),
+        ("stack_service", "MyApp", "web", "MyApp/web"),
+        ("stack_service", "", "web", "myapp-web-1"),
+        ("container", "MyApp", "web", "myapp-web-1"),
+        ("bogus", "MyApp", "web", "myapp-web-1"),
+    ],
+)
+def test_compute_label_per_mode(mode, stack, service, expected):
+    from custom_components.portainer import const
+
+    mode = {
+        "service": const.NAME_MODE_SERVICE,
+        "stack_service": const.NAME_MODE_STACK_SERVICE,
+        "container": const.NAME_MODE_CONTAINER,
+    }.get(mode, mode)
+    c = mkc(1, "myapp-web-1", stack, service)
+    coord = DummyCoordinator({"1:myapp-web-1": c}, options={CONF_CONTAINER_SENSOR_NAME_MODE: mode})
+    btn = PortainerContainerRestartButton(coord, DummyControl(), c)
+    assert btn._compute_label() == expected
+
+
+async def test_failed_restart_button_is_retried_on_next_refresh(monkeypatch):
+    from custom_components.portainer import button as button_mod
+    from custom_components.portainer.const import DOMAIN
+
+    listeners = []
+    monkeypatch.setattr(button_mod, "_ensure_parent_devices", lambda *a, **k: None)
+    monkeypatch.setattr(button_mod, "PortainerControl", lambda api: DummyControl())
+    monkeypatch.setattr(button_mod, "ForceUpdateCheckButton", lambda coord, entry_id: "force")
+    monkeypatch.setattr(
+        button_mod,
+        "async_dispatcher_connect",
+        lambda hass, signal, target: listeners.append(target) or (lambda: None),
+    )
+
+    attempts = []
+
+    class FlakyButton:
+        def __init__(self, coordinator, control, container):
+            attempts.append(container["Name"])
+            if len(attempts) == 1:
+                raise RuntimeError("container data incomplete")
+            self.name = container["Name"]
+
+    monkeypatch.setattr(button_mod, "PortainerContainerRestartButton", FlakyButton)
+
+    coord = DummyCoordinator({"1:web": mkc(1, "web")})
+    coord.api = None
+
+    async def first_refresh():
+        return None
+
+    coord.async_config_entry_first_refresh = first_refresh
+    entry = SimpleNamespace(entry_id="test-entry", async_on_unload=lambda unsub: None)
+    fake_hass = SimpleNamespace(data={DOMAIN: {"test-entry": {"coordinator": coord}}})
+    added = []
+
+    await button_mod.async_setup_entry(
+        fake_hass, entry, lambda entities, update_before_add=False: added.append(list(entities))
+    )
+    assert added == [["force"]]
+
+    # "1:web" is not new any more, but its failed build is retried
+    by_name = coord.raw_data["containers_by_name"]
+    await listeners[0](coord, frozenset(), by_name)
+    assert [b.name for b in added[1]] == ["web"]
+
+    await listeners[0](coord, frozenset(), by_name)
+    assert len(added) == 2 and attempts == ["web", "web"]
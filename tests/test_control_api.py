@@ -1,33 +1,130 @@
 """Test control API without forcing runtime behavior changes."""
+import asyncio
+import types
+
 from custom_components.portainer.control_api import PortainerControl
 
 
-class Resp:
+class AsyncResp:
     def __init__(self, status=204, text=""):
-        self.status_code = status
-        self.text = text
+        self.status = status
+        self._text = text
+
+    async def text(self):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
 
+class DummySession:
+    connector = None
 
-def test_container_restart_url_and_success_204(monkeypatch):
-    captured = {}
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
 
-    def fake_post(url, headers=None, json=None, verify=None, timeout=None):  # noqa: A002
-        captured["url"] = url
-        return Resp(204)
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.response
 
+
+def _async_api(session):
     class DummyApi:
         _url = "http://p/api/"
         _api_key = "k"
         _ssl_verify = True
 
-    monkeypatch.setattr(
-        "custom_components.portainer.control_api.requests_post", fake_post
-    )
-    ctrl = PortainerControl(DummyApi())
+        def _client_session(self):
+            return session
+
+        def http_slots(self):
+            return slots
+
+    slots = asyncio.Semaphore(4)
+    return DummyApi()
+
+
+async def test_async_container_restart_success_204():
+    session = DummySession(AsyncResp(204))
+    ctrl = PortainerControl(_async_api(session))
+
+    assert await ctrl.async_restart_container(1, "abc") is True
+    url, kwargs = session.calls[0]
+    assert url == "http://p/api/endpoints/1/docker/containers/abc/restart"
+    assert kwargs["headers"]["X-API-Key"] == "k"
+
+
+async def test_async_container_restart_failure_status():
+    ctrl = PortainerControl(_async_api(DummySession(AsyncResp(500, "boom"))))
+    assert await ctrl.async_restart_container(1, "abc") is False
+
+
+async def test_async_stack_start_invalidates_stack_cache():
+    session = DummySession(AsyncResp(200))
+    api = _async_api(session)
+    invalidated = []
+    api.invalidate_cache = invalidated.append
+
+    ctrl = PortainerControl(api)
+    assert await ctrl.async_start_stack(2, 7) is True
+    assert session.calls[0][0] == "http://p/api/stacks/7/start?endpointId=2"
+    assert invalidated == ["stacks"]
 
-    ok = ctrl.restart_container(1, "abc")
-    assert ok is True
-    assert (
-        captured["url"]
-        == "http://p/api/endpoints/1/docker/containers/abc/restart"
+
+class CountingSession:
+    """aiohttp stand-in whose connector allows `limit` sockets per host."""
+
+    def __init__(self, limit):
+        self.connector = types.SimpleNamespace(limit_per_host=limit, limit=100)
+        self.in_flight = self.peak = 0
+
+    def _request(self):
+        session = self
+
+        class _Ctx:
+            status = 200
+            reason = "OK"
+
+            async def __aenter__(self):
+                session.in_flight += 1
+                session.peak = max(session.peak, session.in_flight)
+                await asyncio.sleep(0)
+                return self
+
+            async def __aexit__(self, *exc):
+                session.in_flight -= 1
+                return False
+
+            async def read(self):
+                return b"{}"
+
+            async def text(self):
+                return ""
+
+        return _Ctx()
+
+    def get(self, url, **kwargs):
+        return self._request()
+
+    def post(self, url, **kwargs):
+        return self._request()
+
+
+async def test_stats_and_actions_together_stay_within_connector_limit():
+    from custom_components.portainer.api import PortainerAPI
+
+    api = PortainerAPI(types.SimpleNamespace(), host="p:9000", api_key="k")
+    session = CountingSession(limit=3)
+    api._client = session
+    ctrl = PortainerControl(api)
+
+    await asyncio.gather(
+        *(api.get_container_stats(endpoint_id=1, container_id=str(i)) for i in range(6)),
+        *(ctrl.async_restart_container(1, str(i)) for i in range(6)),
     )
+
+    assert session.peak == 3
@@ -1,13 +1,111 @@
-from custom_components.portainer.coordinator import PortainerCoordinator
+from custom_components.portainer.const import CONF_FEATURE_HEALTH_CHECK
+from custom_components.portainer.coordinator import _INSPECT_VALS, PortainerCoordinator
 
 def test_index_containers_by_name_utility():
-    flat_by_id = {
-        "1a": {"EndpointId": 1, "Name": "web", "State": "running"},
-        "1b": {"EndpointId": 1, "Name": "db", "State": "exited"},
-        "2c": {"EndpointId": 2, "Name": "web", "State": "running"},
+    containers = {
+        1: {
+            "a": {"EndpointId": 1, "Name": "web", "State": "running"},
+            "b": {"EndpointId": 1, "Name": "db", "State": "exited"},
+        },
+        2: {"c": {"EndpointId": 2, "Name": "web", "State": "running"}},
     }
     dummy_self = object()
-    index = PortainerCoordinator._index_containers_by_name(dummy_self, flat_by_id)  # type: ignore[arg-type]
+    flat, index, _ = PortainerCoordinator._flatten_and_index_containers(dummy_self, containers)  # type: ignore[arg-type]
+    assert set(flat) == {"1a", "1b", "2c"}
     assert index["1:web"]["State"] == "running"
     assert index["1:db"]["State"] == "exited"
-    assert index["2:web"]["EndpointId"] == 2
\ No newline at end of file
+    assert index["2:web"]["EndpointId"] == 2
+
+def test_index_containers_by_compose_utility():
+    containers = {
+        1: {
+            "a": {"EndpointId": 1, "Name": "app-web-1", "Compose_Stack": "app", "Compose_Service": "web"},
+            "b": {"EndpointId": 1, "Name": "app-web-2", "Compose_Stack": "app", "Compose_Service": "web"},
+            "c": {"EndpointId": 1, "Name": "standalone", "Compose_Stack": "", "Compose_Service": ""},
+        }
+    }
+    dummy_self = object()
+    _, _, index = PortainerCoordinator._flatten_and_index_containers(dummy_self, containers)  # type: ignore[arg-type]
+    assert index[(1, "app", "web")]["Name"] == "app-web-1"
+    assert len(index) == 1
+
+
+def test_diff_container_keys_reports_only_new_keys():
+    coord = PortainerCoordinator.__new__(PortainerCoordinator)
+    coord._known_container_keys = frozenset()
+    coord.raw_data = {"containers_by_name": {"1:web": {}, "1:db": {}}}
+    coord._diff_container_keys()
+    assert coord.new_container_keys == {"1:web", "1:db"}
+
+    coord.raw_data = {"containers_by_name": {"1:web": {}, "1:db": {}, "2:cache": {}}}
+    coord._diff_container_keys()
+    assert coord.new_container_keys == {"2:cache"}
+
+    coord._diff_container_keys()
+    assert coord.new_container_keys == frozenset()
+
+
+async def test_fetch_inspects_fills_requested_fields_for_every_container():
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    async def run(func, *args):
+        return func(*args)
+
+    coord = PortainerCoordinator.__new__(PortainerCoordinator)
+    coord.hass = SimpleNamespace(async_add_executor_job=run)
+    coord.api = MagicMock()
+    coord.api.query.return_value = {
+        "State": {"Health": {"Status": "healthy"}},
+        "HostConfig": {"RestartPolicy": {"Name": "always"}},
+    }
+    coord.raw_data = {"containers": {1: {"a": {}, "b": {}}, 2: {"c": {}}}}
+
+    health_only = [val for feature, val in _INSPECT_VALS if feature == CONF_FEATURE_HEALTH_CHECK]
+    await coord._async_fetch_inspects(health_only)
+
+    assert coord.api.query.call_count == 3
+    assert coord.raw_data["containers"][2]["c"]["_Custom"] == {"Health_Status": "healthy"}
+
+
+async def test_fetch_inspects_bounds_executor_jobs(monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from custom_components.portainer import coordinator as coordinator_mod
+
+    monkeypatch.setattr(coordinator_mod, "INSPECT_MAX_CONCURRENCY", 2)
+    in_flight = peak = 0
+
+    async def run(func, *args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return func(*args)
+
+    coord = PortainerCoordinator.__new__(PortainerCoordinator)
+    coord.hass = SimpleNamespace(async_add_executor_job=run)
+    coord.api = MagicMock()
+    coord.api.query.return_value = {}
+    coord.raw_data = {"containers": {1: {str(i): {} for i in range(10)}}}
+
+    await coord._async_fetch_inspects([])
+
+    assert coord.api.query.call_count == 10
+    assert peak == 2
+
+
+def test_update_features_keeps_dict_identity():
+    from custom_components.portainer.const import CONF_FEATURE_UPDATE_CHECK
+
+    coord = PortainerCoordinator.__new__(PortainerCoordinator)
+    coord.features = {}
+    shared = coord.features  # the update service holds this same reference
+    coord._update_features({CONF_FEATURE_UPDATE_CHECK: True})
+    assert shared[CONF_FEATURE_UPDATE_CHECK] is True
+    coord._update_features({})
+    assert coord.features is shared
+    assert shared[CONF_FEATURE_UPDATE_CHECK] is False
@@ -0,0 +1,34 @@
+from custom_components.portainer.const import DOMAIN
+from custom_components.portainer.device_ids import (
+    container_identifiers,
+    stack_identifiers,
+)
+
+
+def test_identifier_sets_are_shared_and_immutable():
+    ids = container_identifiers(1, "web", "MyApp", "web")
+    assert ids is container_identifiers(1, "web", "MyApp", "web")
+    assert isinstance(ids, frozenset)
+    assert ids == {
+        (DOMAIN, "container_1_web"),
+        (DOMAIN, "container_1_myapp_web"),
+    }
+    assert container_identifiers(1, "web") == {(DOMAIN, "container_1_web")}
+
+
+def test_stack_identifiers_include_legacy_aliases():
+    ids = stack_identifiers(2, 7, "My App")
+    assert ids is stack_identifiers(2, 7, "My App")
+    assert ids == {
+        (DOMAIN, "stack_2_my_app"),
+        (DOMAIN, "stack_2_7"),
+        (DOMAIN, "stack_name_2_my_app"),
+    }
+
+
+def test_slug_matches_unicode_rules():
+    from custom_components.portainer.device_ids import slug
+
+    assert slug("  My App.v2 ") == "my_app_v2"
+    assert slug("a-b_c:d") == "a-b_c_d"
+    assert slug("Café Büro") == "café_büro"
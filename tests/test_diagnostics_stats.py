@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from custom_components.portainer.diagnostics import _collect_stats_diagnostics
+from custom_components.portainer.diagnostics import (
+    _collect_stats_diagnostics,
+    _entry_namespace,
+)
 
 
 class _DummyStatsData:
@@ -50,7 +53,7 @@ def test_collect_stats_diagnostics_basic():
     }
 
     entry = DummyEntry(entry_id)
-    out = _collect_stats_diagnostics(hass, entry)
+    out = _collect_stats_diagnostics(_entry_namespace(hass, entry))
 
     assert "endpoints_loaded" in out and out["endpoints_loaded"] == ["1"]
     assert "containers_indexed" in out and container_key in out["containers_indexed"]
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from custom_components.portainer.entity_factory import EntityFactory
+
+
+def _desc(key, data_path, data_reference=None, func="Sensor"):
+    return SimpleNamespace(
+        key=key,
+        data_path=data_path,
+        data_reference=data_reference,
+        data_attribute=key,
+        func=func,
+    )
+
+
+class _Entity:
+    def __init__(self, coordinator, description, uid=None):
+        self.unique_id = f"{description.key}-{uid}"
+        self.name = description.key
+
+
+def test_create_sensors_snapshots_each_data_path_once():
+    coord = SimpleNamespace(data={"containers": {"a": {}, "b": {}}, "endpoints": {"1": {}}})
+    factory = EntityFactory(coord, {"Sensor": _Entity})
+    descriptions = [
+        _desc("cpu", "containers", "Id"),
+        _desc("ep", "endpoints", "Id"),
+        _desc("mem", "containers", "Id"),
+        _desc("missing", "system"),
+    ]
+
+    calls = []
+    original = factory._process_description_with_reference
+
+    def spy(new_entities, seen_uids, description, uids):
+        calls.append((description.key, uids))
+        return original(new_entities, seen_uids, description, uids)
+
+    factory._process_description_with_reference = spy
+    entities = factory.create_sensors(descriptions)
+
+    assert [e.unique_id for e in entities] == ["cpu-a", "cpu-b", "mem-a", "mem-b", "ep-1"]
+    # Both container descriptions share one snapshot
+    assert calls[0][1] is calls[1][1] == ("a", "b")
+    assert coord.data["system"] == {}
+
+
+def test_blank_values_are_filtered():
+    from custom_components.portainer.entity_factory import _blank
+
+    assert _blank(None) and _blank("") and _blank("   ")
+    assert not _blank("x") and not _blank(1)
+
+    factory = EntityFactory(SimpleNamespace(data={}), {})
+    assert not factory._final_entity_validation(SimpleNamespace(unique_id=" ", name="n"))
+    assert factory._final_entity_validation(SimpleNamespace(unique_id="u", name="n"))
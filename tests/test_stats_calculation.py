@@ -86,3 +86,24 @@ def test_memory_percent_no_limit_returns_zero(stats_payload):
     stats_payload["memory_stats"] = dict(stats_payload["memory_stats"], limit=0)
     used = compute_memory_used_bytes(stats_payload, exclude_cache=True)
     assert compute_memory_percent(stats_payload, used) == 0.0
+
+
+def test_build_stats_data_reuses_result_for_repeated_sample(stats_payload):
+    from custom_components.portainer.coordinator import ContainerStatsCoordinator
+
+    coord = ContainerStatsCoordinator.__new__(ContainerStatsCoordinator)
+    coord._alpha = 0.5
+    coord._exclude_cache = True
+    coord._last_cpu = None
+    coord._last = None
+    coord._last_key = None
+
+    first = coord._build_stats_data(stats_payload)
+    assert coord._build_stats_data(dict(stats_payload)) is first
+    assert coord._last_cpu == pytest.approx(80.0)  # repeated sample not fed to the EWMA again
+
+    changed = dict(stats_payload)
+    changed["memory_stats"] = dict(stats_payload["memory_stats"], usage=600_000_000)
+    second = coord._build_stats_data(changed)
+    assert second is not first
+    assert second.mem_used_bytes == 500_000_000
@@ -29,11 +29,11 @@ class DummyControl:
     def __init__(self):
         self.calls = []
 
-    def start_container(self, endpoint_id, container_id):
+    async def async_start_container(self, endpoint_id, container_id):
         self.calls.append(("start", endpoint_id, container_id))
         return True
 
-    def stop_container(self, endpoint_id, container_id):
+    async def async_stop_container(self, endpoint_id, container_id):
         self.calls.append(("stop", endpoint_id, container_id))
         return True
 
@@ -88,3 +88,14 @@ async def test_container_switch_actions_call_control(hass):
     await sw.async_turn_on()
 
     assert ctrl.calls[-2:] == [("stop", 2, "id-new"), ("start", 2, "id-new")]
+
+
+def test_stack_switch_is_on_uses_compose_stack_index():
+    from custom_components.portainer.switch import PortainerStackSwitch
+
+    coord = DummyCoordinator({"1:app-web-1": mkc(1, "app-web-1", "app", "web")})
+    coord.raw_data["compose_stacks"] = frozenset({(1, "app")})
+    on = PortainerStackSwitch(coord, DummyControl(), {"Id": 5, "EndpointId": 1, "Name": "app"})
+    off = PortainerStackSwitch(coord, DummyControl(), {"Id": 6, "EndpointId": 2, "Name": "app"})
+    assert on.is_on is True
+    assert off.is_on is False
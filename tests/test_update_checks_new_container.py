@@ -110,3 +110,27 @@ def test_parse_image_name_staticmethod():
     assert result["registry"] == "localhost:5000"
     assert result["image_repo"] == "nginx"
     assert result["image_tag"] == "latest"
+
+
+def test_update_description_translations_looked_up_once():
+    from types import SimpleNamespace
+
+    from custom_components.portainer.portainer_update_service import (
+        PortainerUpdateService,
+    )
+
+    hass = SimpleNamespace(translations={})
+    service = PortainerUpdateService(hass, None, None, {}, "entry")
+    # Not loaded yet: built-in text, and nothing is cached
+    assert service._get_update_description(1) == "Update available!"
+
+    hass.translations = {
+        "component.portainer.entity.sensor.update_check_status.state": {
+            "update_status_1": "Aktualisierung verfügbar!"
+        }
+    }
+    assert service._get_update_description(1) == "Aktualisierung verfügbar!"
+
+    hass.translations = {}
+    assert service._get_update_description(1) == "Aktualisierung verfügbar!"
+    assert service._get_update_description(429) == "Registry rate limit reached."